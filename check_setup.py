@@ -5,38 +5,172 @@ Validates environment setup before running main pipeline
 Usage: python check_setup.py
 """
 
+import io
+import os
 import sys
+import threading
 from pathlib import Path
 import importlib.util
 
 
+_BAR = "=" * 60
+_EMOJI_PASS = "✅ PASS"
+_EMOJI_FAIL = "❌ FAIL"
+_EMOJI_SKIP = "⏭ SKIPPED"
+
+
+class _LazyModule:
+    """Module proxy that imports on first attribute access"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+def _lazy(name):
+    """Return a proxy for module `name` without importing it yet"""
+    return _LazyModule(name)
+
+
+yaml = _lazy('yaml')
+
+
+# (subdirs, files) listings keyed by POSIX relpath, filled once by _prefetch_tree()
+_walk_cache = {}
+_WALK_MAX_DEPTH = 3  # deep enough for data/raw/<category>
+
+
+def _prefetch_tree(root='.'):
+    """Cache project directory listings with a single os.walk"""
+    _walk_cache.clear()
+    # Follow links so a symlinked data/ (mounted datasets) is listed like Path.exists() sees it
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
+        rel = Path(os.path.relpath(dirpath, root)).as_posix()
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != '__pycache__']
+        _walk_cache[rel] = (tuple(dirnames), tuple(filenames))
+        if rel != '.' and rel.count('/') + 1 >= _WALK_MAX_DEPTH:
+            dirnames[:] = []
+
+
+def _tree():
+    """Return the cached directory listings, walking the tree on first use"""
+    if not _walk_cache:
+        _prefetch_tree()
+    return _walk_cache
+
+
+_CSV_SUFFIX = '.csv'
+
+
+def _count_csv(path):
+    """Count CSV files in a cached directory listing (0 if the dir is missing)"""
+    _, files = _tree().get(path.as_posix(), ((), ()))
+    return sum(1 for name in files if name.endswith(_CSV_SUFFIX))
+
+
+class _ThreadStdout:
+    """stdout stand-in that routes writes to a per-thread buffer when set"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._stream).write(text)
+
+    def __getattr__(self, attr):
+        return getattr(self._stream, attr)
+
+
+def _run_captured(stdout, check, wait_for=None):
+    """Run a check with its output buffered; returns (result, output)"""
+    if wait_for is not None:
+        wait_for.result()
+    
+    buffer = io.StringIO()
+    stdout._local.buffer = buffer
+    try:
+        return check(), buffer.getvalue()
+    finally:
+        stdout._local.buffer = None
+
+
+def _run_checks(tasks, depends_on):
+    """
+    Run checks concurrently and replay their output in the original order
+    
+    Args:
+        tasks: Ordered list of (check, runner) pairs; runner takes no arguments
+        depends_on: Dict mapping a check to the check it must wait for
+    
+    Returns:
+        list: Check results in the same order as `tasks`
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    stdout = _ThreadStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        futures = {}
+        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+            # Dependencies are listed before their dependents in `tasks`
+            for check, runner in tasks:
+                prereq = futures.get(depends_on.get(check))
+                futures[check] = pool.submit(_run_captured, stdout, runner, prereq)
+    finally:
+        sys.stdout = stdout._stream
+    
+    results = []
+    for check, _ in tasks:
+        result, output = futures[check].result()
+        sys.stdout.write(output)
+        results.append(result)
+    return results
+
+
+def _emit(out, result):
+    """Write a check's buffered lines in one call and pass its result through"""
+    sys.stdout.write('\n'.join(out) + '\n')
+    return result
+
+
 def print_header(text):
     """Print section header"""
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print(f"  {text}")
-    print("=" * 60)
+    print(_BAR)
+
+
+_PY_REQUIRED = (3, 8)
+_PY_VER = sys.version_info
+_PY_OK = _PY_VER[:2] >= _PY_REQUIRED
+_PY_STR = f"{_PY_VER.major}.{_PY_VER.minor}.{_PY_VER.micro}"
+_PY_REQUIRED_STR = f"{_PY_REQUIRED[0]}.{_PY_REQUIRED[1]}+"
 
 
 def check_python_version():
     """Check Python version is 3.8+"""
-    version = sys.version_info
-    required = (3, 8)
-    
-    print("\n[1/7] Checking Python version...")
-    print(f"   Current: {version.major}.{version.minor}.{version.micro}")
-    print(f"   Required: {required[0]}.{required[1]}+")
+    out = []
+    out.append(f"   Current: {_PY_STR}")
+    out.append(f"   Required: {_PY_REQUIRED_STR}")
     
-    if version >= required:
-        print("   ✅ PASS")
-        return True
+    if _PY_OK:
+        out.append(f"   {_EMOJI_PASS}")
+        return _emit(out, True)
     else:
-        print("   ❌ FAIL: Python 3.8+ required")
-        return False
+        out.append(f"   {_EMOJI_FAIL}: Python {_PY_REQUIRED_STR} required")
+        return _emit(out, False)
 
 
 def check_dependencies():
     """Check required Python packages"""
-    print("\n[2/7] Checking dependencies...")
+    out = []
     
     required = {
         'pandas': 'pandas',
@@ -50,238 +184,475 @@ def check_dependencies():
     
     missing = []
     for name, import_name in required.items():
-        spec = importlib.util.find_spec(import_name)
-        if spec is None:
-            print(f"   ❌ {name}: NOT FOUND")
+        # find_spec locates the module without running its __init__
+        if importlib.util.find_spec(import_name) is None:
+            out.append(f"   ❌ {name}: NOT FOUND")
             missing.append(name)
         else:
-            print(f"   ✅ {name}: found")
+            out.append(f"   ✅ {name}: found")
     
     if missing:
-        print(f"\n   ❌ FAIL: Missing packages: {', '.join(missing)}")
-        print("   Run: pip install -r requirements.txt")
-        return False
+        out.append(f"\n   {_EMOJI_FAIL}: Missing packages: {', '.join(missing)}")
+        out.append("   Run: pip install -r requirements.txt")
+        return _emit(out, False)
     else:
-        print("   ✅ PASS: All dependencies installed")
-        return True
+        out.append(f"   {_EMOJI_PASS}: All dependencies installed")
+        return _emit(out, True)
+
+
+_DB_ENV_DEFAULTS = {
+    'host': ('DB_HOST', 'localhost'),
+    'port': ('DB_PORT', '5432'),
+    'database': ('DB_NAME', 'indonesia_demographics'),
+    'user': ('DB_USER', 'postgres'),
+    'password': ('DB_PASSWORD', 'postgres')
+}
+
+
+def _parse_env(path):
+    """Parse KEY=VALUE lines from a .env file without importing dotenv"""
+    env = {}
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        key = key.strip()
+        if key.startswith('export '):
+            key = key[len('export '):].strip()
+        env[key] = value.strip().strip('"\'')
+    return env
 
 
 def check_database_config():
     """Check database configuration"""
-    print("\n[3/7] Checking database configuration...")
+    out = []
     
     env_file = Path('.env')
     
     if not env_file.exists():
-        print("   ❌ FAIL: .env file not found")
-        print("   Run: cp .env.example .env")
-        print("   Then edit .env with your database credentials")
-        return False
+        out.append(f"   {_EMOJI_FAIL}: .env file not found")
+        out.append("   Run: cp .env.example .env")
+        out.append("   Then edit .env with your database credentials")
+        return _emit(out, False)
     
-    # Try to import config
     try:
-        from src.database.config import DB_CONFIG
+        env = _parse_env(env_file)
+        # Same keys and defaults as src.database.config; process env wins like load_dotenv
+        db_config = {
+            key: os.environ.get(var, env.get(var, default))
+            for key, (var, default) in _DB_ENV_DEFAULTS.items()
+        }
+        db_config['port'] = int(db_config['port'])
         
-        print(f"   Host: {DB_CONFIG['host']}")
-        print(f"   Port: {DB_CONFIG['port']}")
-        print(f"   Database: {DB_CONFIG['database']}")
-        print(f"   User: {DB_CONFIG['user']}")
+        out.append(f"   Host: {db_config['host']}")
+        out.append(f"   Port: {db_config['port']}")
+        out.append(f"   Database: {db_config['database']}")
+        out.append(f"   User: {db_config['user']}")
         
-        if DB_CONFIG['password'] == 'postgres':
-            print("   ⚠️  WARNING: Using default password")
+        if db_config['password'] == 'postgres':
+            out.append("   ⚠️  WARNING: Using default password")
         
-        print("   ✅ PASS: Configuration loaded")
-        return True
+        out.append(f"   {_EMOJI_PASS}: Configuration loaded")
+        return _emit(out, True)
         
     except Exception as e:
-        print(f"   ❌ FAIL: Error loading config: {e}")
-        return False
+        out.append(f"   {_EMOJI_FAIL}: Error loading config: {e}")
+        return _emit(out, False)
 
 
 def check_database_connection():
     """Test database connection"""
-    print("\n[4/7] Testing database connection...")
+    out = []
+    
+    if importlib.util.find_spec('psycopg2') is None:
+        out.append(f"   {_EMOJI_FAIL}: psycopg2 not installed")
+        return _emit(out, False)
     
     try:
-        from sqlalchemy import create_engine, text
-        from src.database.config import get_connection_string
-        
-        engine = create_engine(get_connection_string())
-        
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT version()"))
-            version = result.fetchone()[0]
-            print(f"   PostgreSQL: {version.split(',')[0]}")
+        import psycopg2
+        from src.database.config import get_psycopg2_config
+    except ImportError as e:
+        out.append(f"   {_EMOJI_FAIL}: Cannot import database modules: {e}")
+        return _emit(out, False)
+    
+    import socket
+    
+    db_config = get_psycopg2_config()
+    host, port = db_config['host'], int(db_config['port'])
+    
+    # Fail within a second if nothing listens there (skip for Unix socket dirs)
+    if not str(host).startswith('/'):
+        try:
+            socket.create_connection((host, port), timeout=1).close()
+        except OSError as e:
+            out.append(f"   {_EMOJI_FAIL}: Cannot reach {host}:{port}")
+            out.append(f"   Error: {e}")
+            out.append("\n   Troubleshooting:")
+            out.append("   1. Check PostgreSQL is running")
+            out.append("   2. Verify DB_HOST and DB_PORT in .env file")
+            return _emit(out, False)
+    
+    try:
+        # Plain DB-API round trip; no need for the SQLAlchemy engine here
+        conn = psycopg2.connect(**db_config, connect_timeout=2)
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT version()")
+                version = cur.fetchone()[0]
+                out.append(f"   PostgreSQL: {version.split(',')[0]}")
+        finally:
+            conn.close()
         
-        print("   ✅ PASS: Database connection successful")
-        return True
+        out.append(f"   {_EMOJI_PASS}: Database connection successful")
+        return _emit(out, True)
         
     except Exception as e:
-        print(f"   ❌ FAIL: Cannot connect to database")
-        print(f"   Error: {e}")
-        print("\n   Troubleshooting:")
-        print("   1. Check PostgreSQL is running")
-        print("   2. Verify credentials in .env file")
-        print("   3. Ensure database exists (or will be created)")
+        out.append(f"   {_EMOJI_FAIL}: Cannot connect to database")
+        out.append(f"   Error: {e}")
+        out.append("\n   Troubleshooting:")
+        out.append("   1. Check PostgreSQL is running")
+        out.append("   2. Verify credentials in .env file")
+        out.append("   3. Ensure database exists (or will be created)")
+        return _emit(out, False)
+
+
+_REQUIRED_DIRS = tuple(Path(p) for p in (
+    'data/raw',
+    'data/interim',
+    'data/processed',
+    'src/data',
+    'src/database',
+    'src/analysis',
+    'src/models',
+    'reports/figures',
+    'models'
+))
+
+_DATA_SUBDIRS = (
+    ('TFR', Path('data/raw/TFR')),
+    ('ASFR', Path('data/raw/ASFR')),
+    ('Expenditure', Path('data/raw/Pengeluaran'))
+)
+
+
+_DIRS_CACHE_FILE = Path('.setup_check_cache')
+
+
+def _parent_mtimes():
+    """mtime_ns of every directory whose listing decides _REQUIRED_DIRS"""
+    parents = sorted({p.parent.as_posix() for p in _REQUIRED_DIRS})
+    mtimes = {}
+    for parent in parents:
+        try:
+            mtimes[parent] = os.stat(parent).st_mtime_ns
+        except OSError:
+            mtimes[parent] = None
+    return mtimes
+
+
+def _dirs_cache_valid():
+    """True if a previous run found all directories and nothing moved since"""
+    import json
+    
+    try:
+        cached = json.loads(_DIRS_CACHE_FILE.read_text())
+    except (OSError, ValueError):
         return False
+    return cached.get('dirs_ok') is True and cached.get('mtimes') == _parent_mtimes()
+
+
+def _write_dirs_cache():
+    """Record the current parent mtimes after a fully passing check"""
+    import json
+    
+    try:
+        # Create the file first so its own directory entry is in the recorded mtime
+        _DIRS_CACHE_FILE.touch()
+        _DIRS_CACHE_FILE.write_text(json.dumps({'mtimes': _parent_mtimes(), 'dirs_ok': True}))
+    except OSError:
+        pass  # Cache is best-effort
 
 
 def check_directory_structure():
     """Check project directories"""
-    print("\n[5/7] Checking directory structure...")
-    
-    required_dirs = [
-        'data/raw',
-        'data/interim',
-        'data/processed',
-        'src/data',
-        'src/database',
-        'src/analysis',
-        'src/models',
-        'reports/figures',
-        'models'
-    ]
+    out = []
+    
+    if _dirs_cache_valid():
+        out.append(f"   {_EMOJI_PASS}: All directories exist (unchanged since last check)")
+        return _emit(out, True)
+    
+    tree = _tree()
+    
+    # One subdirectory set per parent instead of one existence probe per path
+    subdirs = {}
+    for path in _REQUIRED_DIRS:
+        parent = path.parent.as_posix()
+        if parent not in subdirs:
+            subdirs[parent] = set(tree.get(parent, ((), ()))[0])
     
     missing = []
-    for dir_path in required_dirs:
-        path = Path(dir_path)
-        if not path.exists():
+    for path in _REQUIRED_DIRS:
+        dir_path = path.as_posix()
+        if path.name not in subdirs[path.parent.as_posix()]:
             missing.append(dir_path)
-            print(f"   ⚠️  {dir_path}: missing (will be created)")
+            out.append(f"   ⚠️  {dir_path}: missing (will be created)")
         else:
-            print(f"   ✅ {dir_path}: exists")
+            out.append(f"   ✅ {dir_path}: exists")
     
     if missing:
-        print(f"\n   ⚠️  Some directories missing (will be auto-created)")
+        out.append(f"\n   ⚠️  Some directories missing (will be auto-created)")
     else:
-        print("   ✅ PASS: All directories exist")
+        out.append(f"   {_EMOJI_PASS}: All directories exist")
+        _write_dirs_cache()
     
-    return True  # Not critical, can be created
+    return _emit(out, True)  # Not critical, can be created
 
 
 def check_data_files():
     """Check for required data files"""
-    print("\n[6/7] Checking data files...")
+    out = []
     
-    data_raw = Path('data/raw')
+    total = 0
+    for label, path in _DATA_SUBDIRS:
+        count = _count_csv(path)
+        out.append(f"   {label} files: {count}")
+        total += count
     
-    # Check TFR
-    tfr_dir = data_raw / 'TFR'
-    tfr_files = list(tfr_dir.glob('*.csv')) if tfr_dir.exists() else []
-    print(f"   TFR files: {len(tfr_files)}")
+    if total == 0:
+        out.append("\n   ⚠️  WARNING: No data files found")
+        out.append("   Place your CSV files in data/raw/ subdirectories")
+        out.append("   Or run: python -m src.data.make_dataset")
+        return _emit(out, False)
+    elif total < 18:  # Expected: 2 TFR + 2 ASFR + 16 expenditure
+        out.append(f"\n   ⚠️  WARNING: Only {total} files found (expected ~18)")
+        out.append("   Ensure all data files are copied to data/raw/")
+        return _emit(out, True)  # Allow to continue
+    else:
+        out.append(f"   {_EMOJI_PASS}: {total} data files found")
+        return _emit(out, True)
+
+
+_CONFIG_SECTIONS = (
+    ('forecasting', 'Forecasting'),
+    ('quadrant', 'Quadrant'),
+    ('outputs', 'Output')
+)
+
+_CONFIG_SCHEMA = {
+    'type': 'object',
+    'required': ['forecasting', 'quadrant', 'outputs'],
+    'properties': {
+        'forecasting': {
+            'type': 'object',
+            'required': ['historical_start_year', 'historical_end_year',
+                         'forecast_to_year', 'forecast_horizon_years'],
+            'properties': {
+                'historical_start_year': {'type': 'integer'},
+                'historical_end_year': {'type': 'integer'},
+                'forecast_to_year': {'type': 'integer'},
+                'forecast_horizon_years': {'type': 'integer'}
+            }
+        },
+        'quadrant': {
+            'type': 'object',
+            'required': ['tfr_threshold_method', 'expenditure_threshold_method', 'segments'],
+            'properties': {
+                'tfr_threshold_method': {'type': 'string'},
+                'expenditure_threshold_method': {'type': 'string'},
+                'segments': {'type': 'object'}
+            }
+        },
+        'outputs': {'type': 'object'}
+    }
+}
+
+_SCHEMA_TYPES = {'object': dict, 'integer': int, 'string': str}
+
+_config_validator = None
+
+
+def _get_config_validator():
+    """Build the jsonschema validator once, on first use"""
+    global _config_validator
+    if _config_validator is None:
+        from jsonschema import Draft7Validator
+        _config_validator = Draft7Validator(_CONFIG_SCHEMA)
+    return _config_validator
+
+
+def _walk_schema(value, schema, path='$'):
+    """Minimal type/required walker used when jsonschema is not installed"""
+    expected = _SCHEMA_TYPES[schema['type']]
+    if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+        yield path, f"{value!r} is not of type '{schema['type']}'"
+        return
     
-    # Check ASFR
-    asfr_dir = data_raw / 'ASFR'
-    asfr_files = list(asfr_dir.glob('*.csv')) if asfr_dir.exists() else []
-    print(f"   ASFR files: {len(asfr_files)}")
+    for key in schema.get('required', ()):
+        if key not in value:
+            yield path, f"'{key}' is a required property"
     
-    # Check Expenditure
-    exp_dir = data_raw / 'Pengeluaran'
-    exp_files = list(exp_dir.glob('*.csv')) if exp_dir.exists() else []
-    print(f"   Expenditure files: {len(exp_files)}")
+    for key, subschema in schema.get('properties', {}).items():
+        if key in value:
+            yield from _walk_schema(value[key], subschema, f"{path}.{key}")
+
+
+def _schema_errors(config):
+    """Yield (path, message) for every schema violation in config"""
+    if importlib.util.find_spec('jsonschema') is None:
+        yield from _walk_schema(config, _CONFIG_SCHEMA)
+        return
     
-    total = len(tfr_files) + len(asfr_files) + len(exp_files)
+    for err in _get_config_validator().iter_errors(config):
+        yield err.json_path, err.message
+
+
+def _semantic_errors(config):
+    """Yield (path, message) for cross-field problems in a schema-valid config"""
+    fc = config['forecasting']
     
-    if total == 0:
-        print("\n   ⚠️  WARNING: No data files found")
-        print("   Place your CSV files in data/raw/ subdirectories")
-        print("   Or run: python -m src.data.make_dataset")
-        return False
-    elif total < 18:  # Expected: 2 TFR + 2 ASFR + 16 expenditure
-        print(f"\n   ⚠️  WARNING: Only {total} files found (expected ~18)")
-        print("   Ensure all data files are copied to data/raw/")
-        return True  # Allow to continue
-    else:
-        print(f"   ✅ PASS: {total} data files found")
-        return True
+    if fc['forecast_horizon_years'] <= 0:
+        yield '$.forecasting.forecast_horizon_years', "must be greater than 0"
+    if fc['historical_start_year'] >= fc['historical_end_year']:
+        yield '$.forecasting.historical_start_year', "must be before historical_end_year"
 
 
 def check_config_file():
     """Check analysis configuration file"""
-    print("\n[7/7] Checking analysis configuration...")
+    out = []
     
     config_file = Path('src/models/config.yml')
     
     if not config_file.exists():
-        print("   ❌ FAIL: config.yml not found")
-        return False
+        out.append(f"   {_EMOJI_FAIL}: config.yml not found")
+        return _emit(out, False)
+    
+    if importlib.util.find_spec('yaml') is None:
+        out.append(f"   {_EMOJI_FAIL}: pyyaml not installed")
+        return _emit(out, False)
+    
+    # Stage 1: parse (C loader needs PyYAML built against libyaml)
+    loader = getattr(yaml, 'CSafeLoader', None)
+    if loader is None:
+        out.append("   ⚠️  libyaml not available, using pure-Python YAML loader")
+        loader = yaml.SafeLoader
     
     try:
-        import yaml
         with open(config_file) as f:
-            config = yaml.safe_load(f)
-        
-        print("   ✅ Forecasting config: loaded")
-        print("   ✅ Quadrant config: loaded")
-        print("   ✅ Output config: loaded")
-        print("   ✅ PASS: Configuration file valid")
-        return True
-        
+            config = yaml.load(f, Loader=loader)
     except Exception as e:
-        print(f"   ❌ FAIL: Error loading config: {e}")
-        return False
+        out.append(f"   {_EMOJI_FAIL}: Error loading config: {e}")
+        return _emit(out, False)
+    
+    # Stage 2: structure and types; stage 3: cross-field rules
+    errors = list(_schema_errors(config))
+    if not errors:
+        errors = list(_semantic_errors(config))
+    
+    if isinstance(config, dict):
+        for key, label in _CONFIG_SECTIONS:
+            prefix = f"$.{key}"
+            if not isinstance(config.get(key), dict):
+                out.append(f"   ❌ {label} config: missing")
+            elif any(path == prefix or path.startswith((prefix + '.', prefix + '[')) for path, _ in errors):
+                out.append(f"   ❌ {label} config: invalid")
+            else:
+                out.append(f"   ✅ {label} config: loaded")
+    
+    if errors:
+        for path, message in errors:
+            out.append(f"   ❌ {path}: {message}")
+        out.append(f"   {_EMOJI_FAIL}: Configuration file invalid")
+        return _emit(out, False)
+    
+    out.append(f"   {_EMOJI_PASS}: Configuration file valid")
+    return _emit(out, True)
+
+
+# (summary label, progress heading, check, counts towards "critical")
+CHECKS = [
+    ("Python Version", "Checking Python version...", check_python_version, True),
+    ("Dependencies", "Checking dependencies...", check_dependencies, True),
+    ("Database Config", "Checking database configuration...", check_database_config, True),
+    ("Database Connection", "Testing database connection...", check_database_connection, True),
+    ("Directory Structure", "Checking directory structure...", check_directory_structure, False),
+    ("Data Files", "Checking data files...", check_data_files, False),
+    ("Analysis Config", "Checking analysis configuration...", check_config_file, True)
+]
+
+# Must pass before anything else runs; these lead the CHECKS table
+_CRITICAL_PREREQS = (check_python_version, check_dependencies)
+
+
+def _dispatch(index, entry):
+    """Print the [N/total] heading for a CHECKS entry and run it"""
+    _, heading, check, _ = entry
+    sys.stdout.write(f"\n[{index}/{len(CHECKS)}] {heading}\n")
+    return check()
 
 
 def print_summary(results):
     """Print final summary"""
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     print("  SUMMARY")
-    print("=" * 60)
-    
-    checks = [
-        "Python Version",
-        "Dependencies",
-        "Database Config",
-        "Database Connection",
-        "Directory Structure",
-        "Data Files",
-        "Analysis Config"
-    ]
+    print(_BAR)
     
-    for check, passed in zip(checks, results):
-        status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"  {check:25} {status}")
+    # None marks a check that never ran
+    for (label, _, _, _), passed in zip(CHECKS, results):
+        status = _EMOJI_SKIP if passed is None else _EMOJI_PASS if passed else _EMOJI_FAIL
+        print(f"  {label:25} {status}")
     
-    all_critical = all(results[:4] + [results[6]])  # Critical checks
-    data_ready = results[5]
+    all_critical = all(passed for (_, _, _, critical), passed in zip(CHECKS, results) if critical)
+    data_ready = results[[entry[2] for entry in CHECKS].index(check_data_files)]
     
-    print("\n" + "=" * 60)
+    print("\n" + _BAR)
     
     if all_critical and data_ready:
         print("  ✅ ALL CHECKS PASSED - READY TO RUN")
-        print("=" * 60)
+        print(_BAR)
         print("\n  Run: python main.py")
         return 0
     elif all_critical:
         print("  ⚠️  SYSTEM READY - MISSING DATA FILES")
-        print("=" * 60)
+        print(_BAR)
         print("\n  Next steps:")
         print("  1. Copy data files to data/raw/ directories")
         print("  2. Run: python main.py")
         return 1
     else:
         print("  ❌ SETUP INCOMPLETE")
-        print("=" * 60)
+        print(_BAR)
         print("\n  Fix the failed checks above before running pipeline")
         return 1
 
 
 def main():
     """Run all checks"""
-    print("=" * 60)
+    from functools import partial
+    
+    print(_BAR)
     print("  INDONESIA DEMOGRAPHICS - PRE-FLIGHT CHECK")
-    print("=" * 60)
+    print(_BAR)
     print("\n  Validating environment setup...")
     
-    results = [
-        check_python_version(),
-        check_dependencies(),
-        check_database_config(),
-        check_database_connection(),
-        check_directory_structure(),
-        check_data_files(),
-        check_config_file()
-    ]
+    # Later checks are meaningless without the prerequisites, so stop at the first failure
+    results = []
+    for index, entry in enumerate(CHECKS[:len(_CRITICAL_PREREQS)], 1):
+        passed = _dispatch(index, entry)
+        results.append(passed)
+        if not passed:
+            print(f"\n  ⛔ {entry[0]} check failed - skipping remaining checks")
+            results += [None] * (len(CHECKS) - len(results))
+            sys.exit(print_summary(results))
+    
+    _prefetch_tree()
+    
+    tasks = [
+        (entry[2], partial(_dispatch, index, entry))
+        for index, entry in enumerate(CHECKS, 1)
+    ][len(results):]
+    # The connection test needs the config check to have run first
+    results += _run_checks(tasks, {check_database_connection: check_database_config})
     
     exit_code = print_summary(results)
     sys.exit(exit_code)
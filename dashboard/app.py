@@ -8,8 +8,7 @@ Last Updated: November 2024
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime
 import sys
 from pathlib import Path
@@ -18,7 +17,6 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent / 'src'))
 
 from data_loader import DataLoader
-from visualizations import Visualizer
 
 # Page config
 st.set_page_config(
@@ -39,28 +37,40 @@ def toggle_dark_mode():
 # Get current theme
 dark_mode = st.session_state.dark_mode
 
-# Dynamic CSS based on theme
-if dark_mode:
-    bg_color = "#0f172a"
-    bg_secondary = "#1e293b"
-    text_color = "#e2e8f0"
-    text_secondary = "#94a3b8"
-    card_bg = "#1e293b"
-    card_bg_gradient = "linear-gradient(135deg, #1e293b 0%, #0f172a 100%)"
-    border_color = "#334155"
-    hover_bg = "#334155"
-else:
-    bg_color = "#fafafa"
-    bg_secondary = "#ffffff"
-    text_color = "#111827"
-    text_secondary = "#6b7280"
-    card_bg = "#ffffff"
-    card_bg_gradient = "linear-gradient(135deg, #ffffff 0%, #fafafa 100%)"
-    border_color = "#e5e7eb"
-    hover_bg = "#f9fafb"
+# Theme palettes for the custom CSS
+LIGHT_PALETTE = {
+    'bg_color': "#fafafa",
+    'bg_secondary': "#ffffff",
+    'text_color': "#111827",
+    'text_secondary': "#6b7280",
+    'card_bg': "#ffffff",
+    'card_bg_gradient': "linear-gradient(135deg, #ffffff 0%, #fafafa 100%)",
+    'border_color': "#e5e7eb",
+    'hover_bg': "#f9fafb"
+}
 
-# Professional Custom CSS
-st.markdown(f"""
+DARK_PALETTE = {
+    'bg_color': "#0f172a",
+    'bg_secondary': "#1e293b",
+    'text_color': "#e2e8f0",
+    'text_secondary': "#94a3b8",
+    'card_bg': "#1e293b",
+    'card_bg_gradient': "linear-gradient(135deg, #1e293b 0%, #0f172a 100%)",
+    'border_color': "#334155",
+    'hover_bg': "#334155"
+}
+
+
+def _build_css(palette):
+    """Render the professional custom CSS for a theme palette"""
+    bg_color = palette['bg_color']
+    text_color = palette['text_color']
+    text_secondary = palette['text_secondary']
+    card_bg = palette['card_bg']
+    card_bg_gradient = palette['card_bg_gradient']
+    border_color = palette['border_color']
+    
+    return f"""
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;600&display=swap');
     
@@ -119,6 +129,12 @@ st.markdown(f"""
         50% {{ opacity: 0.5; }}
     }}
     
+    .metric-grid {{
+        display: grid;
+        grid-template-columns: repeat(4, minmax(0, 1fr));
+        gap: 1rem;
+    }}
+    
     .metric-card {{
         background: {card_bg_gradient};
         padding: 1.75rem;
@@ -243,7 +259,146 @@ st.markdown(f"""
     footer {{visibility: hidden;}}
     header {{visibility: hidden;}}
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource
+def get_theme_css(dark_mode: bool):
+    """Theme CSS built once per theme and reused across reruns"""
+    return _build_css(DARK_PALETTE if dark_mode else LIGHT_PALETTE)
+
+
+# Professional Custom CSS
+st.markdown(get_theme_css(dark_mode), unsafe_allow_html=True)
+
+
+SEGMENT_ORDER = ('Stars', 'Cash Cows', 'Developing', 'Saturated')
+
+
+def categorize_segments(df):
+    """Store the segment column as a Categorical of the segments present"""
+    if df is None or 'segment' not in df.columns:
+        return df
+    
+    present = set(df['segment'].dropna().unique())
+    categories = [s for s in SEGMENT_ORDER if s in present] + sorted(present.difference(SEGMENT_ORDER))
+    return df.assign(segment=pd.Categorical(df['segment'], categories=categories))
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def load_all_data():
+    """Load every dataset once; reruns reuse the cached frames"""
+    loader = DataLoader()
+    data = {
+        'segmentation': categorize_segments(loader.load_market_segmentation()),
+        'segment_stats': loader.load_segment_statistics(),
+        'national_forecast': loader.load_national_forecast(),
+        'regional_forecasts': loader.load_regional_forecasts(),
+        'expenditure_historical': loader.load_expenditure_historical(),
+        'tfr_data': loader.load_tfr_data()
+    }
+    data['_valid_keys'] = tuple(k for k, v in data.items() if isinstance(v, pd.DataFrame) and not v.empty)
+    data['summary_stats'] = compute_summary_stats(data['segmentation'], data['national_forecast'])
+    return data
+
+
+def compute_summary_stats(segmentation, national_forecast):
+    """Scalars for the executive summary metrics, computed once per load"""
+    stars_count = 0
+    if segmentation is not None and 'segment' in segmentation.columns:
+        stars_count = int((segmentation['segment'] == 'Stars').sum())
+    
+    current_exp = future_exp = 0.0
+    if national_forecast is not None and not national_forecast.empty:
+        historical = national_forecast.loc[national_forecast['type'] == 'historical', 'expenditure']
+        current_exp = float(historical.iloc[-1]) if len(historical) > 0 else 0.0
+        target = national_forecast.loc[national_forecast['year'] == 2030, 'expenditure']
+        future_exp = float(target.iloc[0]) if len(target) > 0 else current_exp
+    
+    return {
+        'stars_count': stars_count,
+        'current_exp': current_exp,
+        'future_exp': future_exp
+    }
+
+
+def _hash_dataframe(df):
+    """
+    Cheap cache key for the read-only dashboard frames
+    
+    Shape, schema and index labels identify which rows a filtered view holds;
+    only the first and last rows are content-hashed.
+    """
+    edge_rows = df.iloc[[0, -1]] if len(df) > 0 else df
+    return (
+        df.shape,
+        tuple(df.columns),
+        tuple(df.dtypes.astype(str)),
+        pd.util.hash_array(df.index.to_numpy()).tobytes(),
+        pd.util.hash_pandas_object(edge_rows, index=False).values.tobytes()
+    )
+
+
+_DF_HASH_FUNCS = {pd.DataFrame: _hash_dataframe}
+
+
+@st.cache_resource
+def get_visualizer(dark_mode: bool):
+    """One Visualizer per theme for the lifetime of the server"""
+    # Imported here so plotly only loads once a chart is rendered
+    from visualizations import Visualizer
+    return Visualizer(dark_mode=dark_mode)
+
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS, ttl=3600, max_entries=32)
+def build_segment_pie(df, dark_mode):
+    """Cached segment distribution pie"""
+    return get_visualizer(dark_mode).create_segment_pie(df)
+
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS, ttl=3600, max_entries=32)
+def build_forecast_chart(df, dark_mode):
+    """Cached national forecast chart"""
+    return get_visualizer(dark_mode).create_forecast_chart(df)
+
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS, ttl=3600, max_entries=32)
+def build_quadrant_plot(df, dark_mode):
+    """Cached quadrant scatter"""
+    return get_visualizer(dark_mode).create_quadrant_plot(df)
+
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def lower_regions(df):
+    """Lower-cased region names as a NumPy string array for fast search"""
+    return np.char.lower(df['region'].fillna('').astype(str).to_numpy().astype('U'))
+
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def unique_sorted(df, col):
+    """Sorted distinct values of a column, reused across reruns"""
+    return sorted(df[col].unique().tolist())
+
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def deep_mem_kb(df):
+    """Deep memory footprint in KB, measured once per dataset"""
+    return df.memory_usage(deep=True).sum() / 1024
+
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def df_to_csv_bytes(df):
+    """CSV download payload, encoded once per frame"""
+    return df.to_csv(index=False).encode('utf-8')
+
+
+@st.cache_data(hash_funcs=_DF_HASH_FUNCS)
+def region_index(df):
+    """Row records keyed by region name; first occurrence wins"""
+    index = {}
+    for region, record in zip(df['region'].to_numpy(), df.to_dict('records')):
+        index.setdefault(region, record)
+    return index
 
 
 def get_region_column(df):
@@ -251,10 +406,11 @@ def get_region_column(df):
     Find the region column name in dataframe
     Handles various possible column names
     """
-    possible_names = ['region', 'Region', 'nama_kabupaten_kota', 'wilayah', 'daerah', 'kabupaten_kota']
+    possible_names = ('region', 'Region', 'nama_kabupaten_kota', 'wilayah', 'daerah', 'kabupaten_kota')
+    columns = set(df.columns)
     
     for col in possible_names:
-        if col in df.columns:
+        if col in columns:
             return col
     
     # If no match, return first string column
@@ -272,19 +428,45 @@ def standardize_dataframe(df):
     if df is None or df.empty:
         return df
     
-    # Create a copy
-    df = df.copy()
-    
-    # Find region column
+    # Alias the region column without copying the frame
     region_col = get_region_column(df)
-    if region_col != 'region':
-        df['region'] = df[region_col]
-    
-    return df
+    return df if region_col == 'region' else df.assign(region=df[region_col])
 
 
-def show_executive_summary(data):
+METRIC_CARD_TEMPLATE = """<div class="metric-card">
+    <div class="metric-label">{label}</div>
+    <div class="metric-value">{value}</div>
+    <div class="metric-delta delta-{type}">{delta}</div>
+</div>"""
+
+SEGMENT_CARD_CONFIG = {
+    'Stars': {'emoji': '⭐', 'class': 'segment-stars'},
+    'Cash Cows': {'emoji': '🎯', 'class': 'segment-cashcows'},
+    'Developing': {'emoji': '📊', 'class': 'segment-developing'},
+    'Saturated': {'emoji': '⚠️', 'class': 'segment-saturated'}
+}
+
+SEGMENT_CARD_TEMPLATE = """
+<div class="segment-card {class}" style="border-left-color: #667eea;">
+    <span class="segment-emoji">{emoji}</span>
+    <div class="segment-title">{segment}</div>
+    <div class="segment-stat">
+        <span>Regions:</span><span><strong>{count}</strong></span>
+    </div>
+    <div class="segment-stat">
+        <span>Avg TFR:</span><span><strong>{tfr_mean:.2f}</strong></span>
+    </div>
+    <div class="segment-stat">
+        <span>Avg Spend:</span><span><strong>Rp {expenditure_mean:,.0f}k</strong></span>
+    </div>
+</div>
+"""
+
+
+@st.fragment
+def show_executive_summary():
     """Executive Summary Dashboard"""
+    data = st.session_state['data']
     
     st.markdown('<div class="section-header">📊 Market Overview</div>', unsafe_allow_html=True)
     st.markdown('<div class="section-subheader">Key metrics and insights into Indonesian demographic landscape</div>', unsafe_allow_html=True)
@@ -298,32 +480,24 @@ def show_executive_summary(data):
         return
     
     # Metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
+    summary_stats = data['summary_stats']
     total_regions = len(segmentation)
-    stars_count = len(segmentation[segmentation['segment'] == 'Stars']) if 'segment' in segmentation.columns else 0
+    stars_count = summary_stats['stars_count']
     stars_pct = (stars_count / total_regions * 100) if total_regions > 0 else 0
     
-    current_exp = national_forecast[national_forecast['type'] == 'historical']['expenditure'].iloc[-1] if not national_forecast.empty else 0
-    future_exp = national_forecast[national_forecast['year'] == 2030]['expenditure'].iloc[0] if len(national_forecast[national_forecast['year'] == 2030]) > 0 else current_exp
+    current_exp = summary_stats['current_exp']
+    future_exp = summary_stats['future_exp']
     growth_pct = ((future_exp / current_exp) - 1) * 100 if current_exp > 0 else 0
     
     metrics = [
-        {'col': col1, 'value': f"{total_regions:,}", 'label': 'Regions Analyzed', 'delta': 'Kabupaten & Kota', 'type': 'neutral'},
-        {'col': col2, 'value': f"{stars_count}", 'label': 'High-Value Markets', 'delta': f"⭐ {stars_pct:.1f}% Stars", 'type': 'positive'},
-        {'col': col3, 'value': f"Rp {current_exp:,.0f}k", 'label': 'Current Avg Spend', 'delta': 'Per capita 2025', 'type': 'neutral'},
-        {'col': col4, 'value': f"Rp {future_exp:,.0f}k", 'label': '2030 Projection', 'delta': f"↗ +{growth_pct:.1f}%", 'type': 'positive'}
+        {'value': f"{total_regions:,}", 'label': 'Regions Analyzed', 'delta': 'Kabupaten & Kota', 'type': 'neutral'},
+        {'value': f"{stars_count}", 'label': 'High-Value Markets', 'delta': f"⭐ {stars_pct:.1f}% Stars", 'type': 'positive'},
+        {'value': f"Rp {current_exp:,.0f}k", 'label': 'Current Avg Spend', 'delta': 'Per capita 2025', 'type': 'neutral'},
+        {'value': f"Rp {future_exp:,.0f}k", 'label': '2030 Projection', 'delta': f"↗ +{growth_pct:.1f}%", 'type': 'positive'}
     ]
     
-    for m in metrics:
-        with m['col']:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-label">{m['label']}</div>
-                <div class="metric-value">{m['value']}</div>
-                <div class="metric-delta delta-{m['type']}">{m['delta']}</div>
-            </div>
-            """, unsafe_allow_html=True)
+    cards = ''.join(METRIC_CARD_TEMPLATE.format(**m) for m in metrics)
+    st.markdown(f'<div class="metric-grid">{cards}</div>', unsafe_allow_html=True)
     
     st.markdown('<hr class="divider">', unsafe_allow_html=True)
     
@@ -333,8 +507,7 @@ def show_executive_summary(data):
     with col1:
         st.markdown('### 🎯 Market Distribution')
         try:
-            viz = Visualizer(dark_mode=dark_mode)
-            fig = viz.create_segment_pie(segmentation)
+            fig = build_segment_pie(segmentation, dark_mode)
             st.plotly_chart(fig, use_container_width=True)
         except Exception as e:
             st.error(f"Chart error: {e}")
@@ -342,44 +515,32 @@ def show_executive_summary(data):
     with col2:
         st.markdown('### 📈 Segment Profiles')
         if segment_stats is not None and not segment_stats.empty:
-            segment_config = {
-                'Stars': {'emoji': '⭐', 'class': 'segment-stars'},
-                'Cash Cows': {'emoji': '🎯', 'class': 'segment-cashcows'},
-                'Developing': {'emoji': '📊', 'class': 'segment-developing'},
-                'Saturated': {'emoji': '⚠️', 'class': 'segment-saturated'}
-            }
-            
-            for idx, row in segment_stats.iterrows():
-                config = segment_config.get(row['segment'], {'emoji': '•', 'class': 'segment-card'})
-                st.markdown(f"""
-                <div class="segment-card {config['class']}" style="border-left-color: #667eea;">
-                    <span class="segment-emoji">{config['emoji']}</span>
-                    <div class="segment-title">{row['segment']}</div>
-                    <div class="segment-stat">
-                        <span>Regions:</span><span><strong>{int(row['count'])}</strong></span>
-                    </div>
-                    <div class="segment-stat">
-                        <span>Avg TFR:</span><span><strong>{row['tfr_mean']:.2f}</strong></span>
-                    </div>
-                    <div class="segment-stat">
-                        <span>Avg Spend:</span><span><strong>Rp {row['expenditure_mean']:,.0f}k</strong></span>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+            cards = []
+            for r in segment_stats.to_dict('records'):
+                config = SEGMENT_CARD_CONFIG.get(r['segment'], {'emoji': '•', 'class': 'segment-card'})
+                cards.append(SEGMENT_CARD_TEMPLATE.format(
+                    segment=r['segment'],
+                    count=int(r['count']),
+                    tfr_mean=r['tfr_mean'],
+                    expenditure_mean=r['expenditure_mean'],
+                    **config
+                ))
+            st.markdown(''.join(cards), unsafe_allow_html=True)
     
     st.markdown('<hr class="divider">', unsafe_allow_html=True)
     st.markdown('### 📈 National Expenditure Trajectory')
     
     try:
-        viz = Visualizer(dark_mode=dark_mode)
-        fig = viz.create_forecast_chart(national_forecast)
+        fig = build_forecast_chart(national_forecast, dark_mode)
         st.plotly_chart(fig, use_container_width=True)
     except Exception as e:
         st.error(f"Forecast chart error: {e}")
 
 
-def show_market_segmentation(data):
+@st.fragment
+def show_market_segmentation():
     """Market Segmentation Analysis"""
+    data = st.session_state['data']
     
     st.markdown('<div class="section-header">🎯 Market Segmentation</div>', unsafe_allow_html=True)
     st.markdown('<div class="section-subheader">Regional classification based on fertility rates and purchasing power</div>', unsafe_allow_html=True)
@@ -395,7 +556,7 @@ def show_market_segmentation(data):
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        segments = ['All'] + sorted(segmentation['segment'].unique().tolist()) if 'segment' in segmentation.columns else ['All']
+        segments = ['All'] + unique_sorted(segmentation, 'segment') if 'segment' in segmentation.columns else ['All']
         selected_segment = st.selectbox("Market Segment", segments)
     
     with col2:
@@ -420,18 +581,20 @@ def show_market_segmentation(data):
         else:
             exp_range = (0, 100000)
     
-    # Apply filters
-    filtered_data = segmentation.copy()
-    if selected_segment != 'All' and 'segment' in filtered_data.columns:
-        filtered_data = filtered_data[filtered_data['segment'] == selected_segment]
+    # Apply filters as one boolean mask over the raw column arrays
+    mask = np.ones(len(segmentation), dtype=bool)
+    if selected_segment != 'All' and 'segment' in segmentation.columns:
+        mask &= (segmentation['segment'] == selected_segment).to_numpy()
     
-    if 'tfr' in filtered_data.columns and 'expenditure' in filtered_data.columns:
-        filtered_data = filtered_data[
-            (filtered_data['tfr'] >= tfr_range[0]) & 
-            (filtered_data['tfr'] <= tfr_range[1]) &
-            (filtered_data['expenditure'] >= exp_range[0]) & 
-            (filtered_data['expenditure'] <= exp_range[1])
-        ]
+    if 'tfr' in segmentation.columns and 'expenditure' in segmentation.columns:
+        tfr_vals = segmentation['tfr'].to_numpy()
+        exp_vals = segmentation['expenditure'].to_numpy()
+        mask &= (
+            (tfr_vals >= tfr_range[0]) & (tfr_vals <= tfr_range[1]) &
+            (exp_vals >= exp_range[0]) & (exp_vals <= exp_range[1])
+        )
+    
+    filtered_data = segmentation.iloc[np.flatnonzero(mask)]
     
     st.info(f"📊 Showing **{len(filtered_data)}** of {len(segmentation)} regions")
     
@@ -440,8 +603,7 @@ def show_market_segmentation(data):
     
     # Quadrant Plot
     try:
-        viz = Visualizer(dark_mode=dark_mode)
-        fig = viz.create_quadrant_plot(filtered_data)
+        fig = build_quadrant_plot(filtered_data, dark_mode)
         st.plotly_chart(fig, use_container_width=True)
     except Exception as e:
         st.error(f"⚠️ Chart error: {str(e)}")
@@ -452,9 +614,11 @@ def show_market_segmentation(data):
     
     search_term = st.text_input("🔍 Search regions", placeholder="Type region name...", label_visibility="visible")
     
-    display_data = filtered_data.copy()
-    if search_term and 'region' in display_data.columns:
-        display_data = display_data[display_data['region'].str.contains(search_term, case=False, na=False)]
+    display_data = filtered_data
+    if search_term and 'region' in segmentation.columns:
+        # Plain case-insensitive substring match, combined with the filter mask
+        found = np.char.find(lower_regions(segmentation), search_term.lower()) >= 0
+        display_data = segmentation.iloc[np.flatnonzero(mask & found)]
     
     required_cols = ['region', 'segment', 'tfr', 'expenditure']
     if all(col in display_data.columns for col in required_cols):
@@ -462,14 +626,15 @@ def show_market_segmentation(data):
         display_df.columns = ['Region', 'Segment', 'TFR', 'Expenditure (Rp 000)']
         st.dataframe(display_df, use_container_width=True, height=400)
         
-        csv = display_df.to_csv(index=False)
-        st.download_button("📥 Download Data", csv, "segmentation.csv", "text/csv")
+        st.download_button("📥 Download Data", df_to_csv_bytes(display_df), "segmentation.csv", "text/csv")
     else:
         st.warning(f"⚠️ Required columns not found. Available: {', '.join(display_data.columns)}")
 
 
-def show_forecasting(data):
+@st.fragment
+def show_forecasting():
     """Forecasting Analysis"""
+    data = st.session_state['data']
     
     st.markdown('<div class="section-header">🔮 Expenditure Forecasting</div>', unsafe_allow_html=True)
     st.markdown('<div class="section-subheader">Where spending is headed through 2030</div>', unsafe_allow_html=True)
@@ -483,8 +648,7 @@ def show_forecasting(data):
     st.markdown("### National Trajectory")
     
     try:
-        viz = Visualizer(dark_mode=dark_mode)
-        fig = viz.create_forecast_chart(national_forecast)
+        fig = build_forecast_chart(national_forecast, dark_mode)
         st.plotly_chart(fig, use_container_width=True)
     except Exception as e:
         st.error(f"Chart error: {e}")
@@ -509,8 +673,10 @@ def show_forecasting(data):
             """)
 
 
-def show_regional_analysis(data):
+@st.fragment
+def show_regional_analysis():
     """Regional Analysis"""
+    data = st.session_state['data']
     
     st.markdown('<div class="section-header">🗺️ Regional Analysis</div>', unsafe_allow_html=True)
     st.markdown('<div class="section-subheader">Deep dive into individual markets</div>', unsafe_allow_html=True)
@@ -525,11 +691,11 @@ def show_regional_analysis(data):
         st.error("⚠️ Region column not found in data")
         return
     
-    regions = sorted(segmentation['region'].unique())
+    regions = unique_sorted(segmentation, 'region')
     selected_region = st.selectbox("Select a region", regions, label_visibility="visible")
     
     if selected_region:
-        region_data = segmentation[segmentation['region'] == selected_region].iloc[0]
+        region_data = region_index(segmentation)[selected_region]
         
         st.markdown('<hr class="divider">', unsafe_allow_html=True)
         
@@ -551,31 +717,32 @@ def show_regional_analysis(data):
         """, unsafe_allow_html=True)
 
 
-def show_data_explorer(data):
+@st.fragment
+def show_data_explorer():
     """Data Explorer"""
+    data = st.session_state['data']
     
     st.markdown('<div class="section-header">📁 Data Explorer</div>', unsafe_allow_html=True)
     
-    datasets = {k: v for k, v in data.items() if v is not None and not (isinstance(v, pd.DataFrame) and v.empty)}
+    valid_keys = data['_valid_keys']
     
-    if not datasets:
+    if not valid_keys:
         st.warning("⚠️ No data available")
         return
     
-    dataset_name = st.selectbox("Choose dataset", list(datasets.keys()), label_visibility="visible")
-    selected_data = datasets[dataset_name]
+    dataset_name = st.selectbox("Choose dataset", valid_keys, label_visibility="visible")
+    selected_data = data[dataset_name]
     
     if selected_data is not None and not selected_data.empty:
         col1, col2, col3 = st.columns(3)
         col1.metric("Rows", f"{len(selected_data):,}")
         col2.metric("Columns", len(selected_data.columns))
-        col3.metric("Memory", f"{selected_data.memory_usage(deep=True).sum() / 1024:.1f} KB")
+        col3.metric("Memory", f"{deep_mem_kb(selected_data):.1f} KB")
         
         st.markdown('<hr class="divider">', unsafe_allow_html=True)
         st.dataframe(selected_data, use_container_width=True, height=400)
         
-        csv = selected_data.to_csv(index=False)
-        st.download_button(f"📥 Download {dataset_name}", csv, f"{dataset_name.lower().replace(' ', '_')}.csv", "text/csv")
+        st.download_button(f"📥 Download {dataset_name}", df_to_csv_bytes(selected_data), f"{dataset_name.lower().replace(' ', '_')}.csv", "text/csv")
 
 
 def main():
@@ -621,29 +788,21 @@ def main():
     """)
     
     # Load data
-    loader = DataLoader()
-    
     try:
-        data = {
-            'segmentation': loader.load_market_segmentation(),
-            'segment_stats': loader.load_segment_statistics(),
-            'national_forecast': loader.load_national_forecast(),
-            'regional_forecasts': loader.load_regional_forecasts(),
-            'expenditure_historical': loader.load_expenditure_historical(),
-            'tfr_data': loader.load_tfr_data()
-        }
+        # Fragments rerun on their own, so they read the data from session state
+        st.session_state['data'] = load_all_data()
         
         # Route to pages
         if "Executive Summary" in page:
-            show_executive_summary(data)
+            show_executive_summary()
         elif "Market Segmentation" in page:
-            show_market_segmentation(data)
+            show_market_segmentation()
         elif "Forecasting" in page:
-            show_forecasting(data)
+            show_forecasting()
         elif "Regional Analysis" in page:
-            show_regional_analysis(data)
+            show_regional_analysis()
         elif "Data Explorer" in page:
-            show_data_explorer(data)
+            show_data_explorer()
             
     except Exception as e:
         st.error(f"⚠️ Error loading data: {str(e)}")
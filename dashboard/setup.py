@@ -8,6 +8,43 @@ import shutil
 from pathlib import Path
 import sys
 
+DATA_SUFFIXES = ('.csv', '.parquet')
+
+
+def count_data_files(directory):
+    """Count datasets in a directory; a CSV and its Parquet copy count once"""
+    return len({f.stem for f in directory.iterdir() if f.suffix in DATA_SUFFIXES})
+
+
+def convert_to_parquet(directory):
+    """
+    Write Parquet copies of the CSVs the dashboard loader reads
+    
+    The CSVs are kept; the loader only prefers a copy that is not older.
+    
+    Args:
+        directory: Directory holding the copied CSV files
+        
+    Returns:
+        Number of files converted
+    """
+    try:
+        import pandas as pd
+        import pyarrow  # noqa: F401
+        from src.data_loader import CSV_DTYPES
+    except ImportError as e:
+        print(f"   ⚠️  {e.name} not available - skipping Parquet conversion")
+        return 0
+    
+    converted = 0
+    for filename, dtypes in CSV_DTYPES.items():
+        csv_path = directory / filename
+        if not csv_path.exists():
+            continue
+        pd.read_csv(csv_path, dtype=dtypes).to_parquet(csv_path.with_suffix('.parquet'), engine='pyarrow', index=False)
+        converted += 1
+    return converted
+
 
 def setup_dashboard_data():
     """Copy required data files to dashboard directory"""
@@ -70,14 +107,18 @@ def setup_dashboard_data():
         else:
             print(f"   ⚠️  {filename} not found (optional)")
     
+    print("\n🗜️  Converting to Parquet...")
+    converted = convert_to_parquet(dest_processed) + convert_to_parquet(dest_interim)
+    print(f"   ✓ {converted} files converted")
+    
     # Check data size
     total_size = sum(f.stat().st_size for f in dest_processed.glob('*'))
     total_size += sum(f.stat().st_size for f in dest_interim.glob('*'))
     total_size_mb = total_size / (1024 * 1024)
     
     print(f"\n📊 Data Statistics:")
-    print(f"   Processed files: {len(list(dest_processed.glob('*.csv')))}")
-    print(f"   Interim files: {len(list(dest_interim.glob('*.csv')))}")
+    print(f"   Processed files: {count_data_files(dest_processed)}")
+    print(f"   Interim files: {count_data_files(dest_interim)}")
     print(f"   Total size: {total_size_mb:.2f} MB")
     
     if total_size_mb > 50:
@@ -123,10 +164,10 @@ def verify_dashboard():
     
     # Check data
     data_dir = dashboard_root / 'data' / 'processed'
-    if not data_dir.exists() or len(list(data_dir.glob('*.csv'))) == 0:
+    if not data_dir.exists() or count_data_files(data_dir) == 0:
         print("   ⚠️  No data files found - dashboard will use sample data")
     else:
-        print(f"   ✓ Data files found: {len(list(data_dir.glob('*.csv')))}")
+        print(f"   ✓ Data files found: {count_data_files(data_dir)}")
     
     print("\n   ✅ Dashboard ready to run!")
     return True
@@ -7,6 +7,24 @@ import pandas as pd
 from pathlib import Path
 import streamlit as st
 
+# Files the loader reads, with declared column types so CSV and Parquet load alike
+CSV_DTYPES = {
+    'national_expenditure_forecast.csv': {
+        'year': 'int16', 'expenditure': 'float64', 'lower_ci': 'float64', 'upper_ci': 'float64'
+    },
+    'regional_expenditure_forecasts.csv': {
+        'year': 'int16', 'expenditure': 'float64', 'lower_ci': 'float64', 'upper_ci': 'float64'
+    },
+    'market_segmentation.csv': {'tfr': 'float64', 'expenditure': 'float64'},
+    'segment_statistics.csv': {
+        'count': 'int64',
+        'tfr_mean': 'float64', 'tfr_median': 'float64', 'tfr_std': 'float64',
+        'expenditure_mean': 'float64', 'expenditure_median': 'float64', 'expenditure_std': 'float64'
+    },
+    'expenditure_clean.csv': {'year': 'int16', 'expenditure': 'float64'},
+    'tfr_clean.csv': {'year': 'int16', 'tfr': 'float64'},
+}
+
 
 class DataLoader:
     """Load and cache dashboard data"""
@@ -39,10 +57,19 @@ class DataLoader:
         self.processed_dir = self.data_dir / 'processed'
         self.interim_dir = self.data_dir / 'interim'
     
+    def _read_table(self, csv_path):
+        """Read a data file, preferring its Parquet copy unless the CSV is newer"""
+        parquet_path = csv_path.with_suffix('.parquet')
+        if parquet_path.exists() and (
+            not csv_path.exists() or parquet_path.stat().st_mtime >= csv_path.stat().st_mtime
+        ):
+            return pd.read_parquet(parquet_path, engine='pyarrow')
+        return pd.read_csv(csv_path, dtype=CSV_DTYPES.get(csv_path.name))
+    
     def load_national_forecast(self):
         """Load national expenditure forecast"""
         try:
-            df = pd.read_csv(self.processed_dir / 'national_expenditure_forecast.csv')
+            df = self._read_table(self.processed_dir / 'national_expenditure_forecast.csv')
             return df
         except FileNotFoundError:
             st.warning("National forecast data not found")
@@ -51,7 +78,7 @@ class DataLoader:
     def load_regional_forecasts(self):
         """Load regional expenditure forecasts"""
         try:
-            df = pd.read_csv(self.processed_dir / 'regional_expenditure_forecasts.csv')
+            df = self._read_table(self.processed_dir / 'regional_expenditure_forecasts.csv')
             return df
         except FileNotFoundError:
             st.warning("Regional forecast data not found")
@@ -60,7 +87,7 @@ class DataLoader:
     def load_market_segmentation(self):
         """Load market segmentation data"""
         try:
-            df = pd.read_csv(self.processed_dir / 'market_segmentation.csv')
+            df = self._read_table(self.processed_dir / 'market_segmentation.csv')
             return df
         except FileNotFoundError:
             st.warning("Market segmentation data not found")
@@ -69,7 +96,7 @@ class DataLoader:
     def load_segment_statistics(self):
         """Load segment statistics"""
         try:
-            df = pd.read_csv(self.processed_dir / 'segment_statistics.csv')
+            df = self._read_table(self.processed_dir / 'segment_statistics.csv')
             return df
         except FileNotFoundError:
             # Calculate from segmentation if not available
@@ -79,7 +106,7 @@ class DataLoader:
     def load_expenditure_historical(self):
         """Load historical expenditure data"""
         try:
-            df = pd.read_csv(self.interim_dir / 'expenditure_clean.csv')
+            df = self._read_table(self.interim_dir / 'expenditure_clean.csv')
             return df
         except FileNotFoundError:
             st.warning("Historical expenditure data not found")
@@ -88,7 +115,7 @@ class DataLoader:
     def load_tfr_data(self):
         """Load TFR data"""
         try:
-            df = pd.read_csv(self.interim_dir / 'tfr_clean.csv')
+            df = self._read_table(self.interim_dir / 'tfr_clean.csv')
             return df
         except FileNotFoundError:
             st.warning("TFR data not found")
@@ -5,84 +5,166 @@ Custom Plotly visualizations with theme support
 Author: Data Science Team
 """
 
+import functools
 import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
 import numpy as np
 
 
+# plotly.express Set2 qualitative palette, inlined to avoid importing plotly.express
+_SET2 = ['#66c2a5', '#fc8d62', '#8da0cb', '#e78ac3', '#a6d854', '#ffd92f', '#e5c494', '#b3b3b3']
+
+# Strategic segment order; also the categorical dtype used for counting
+_SEGMENT_ORDER = ['Stars', 'Cash Cows', 'Developing', 'Saturated']
+_SEGMENT_DTYPE = pd.CategoricalDtype(categories=_SEGMENT_ORDER)
+
+# Above this many rows the regional chart is rasterized with datashader
+_RASTERIZE_THRESHOLD = 10_000
+
+# Quadrant label placement as (tfr multiplier, expenditure multiplier, segment)
+_QUADRANT_SPEC = (
+    (1.3, 1.15, 'Stars'),
+    (0.7, 1.15, 'Cash Cows'),
+    (1.3, 0.85, 'Developing'),
+    (0.7, 0.85, 'Saturated')
+)
+
+_THEMES = {
+    True: {
+        'bg_color': '#0f172a',
+        'plot_bg': '#1e293b',
+        'text_color': '#e2e8f0',
+        'text_secondary': '#94a3b8',
+        'grid_color': '#334155',
+        'template': 'plotly_dark'
+    },
+    False: {
+        'bg_color': 'white',
+        'plot_bg': '#fafafa',
+        'text_color': '#374151',
+        'text_secondary': '#6b7280',
+        'grid_color': '#e5e7eb',
+        'template': 'plotly_white'
+    }
+}
+
+
+def _build_layout_template(theme):
+    """Professional chart layout for a theme"""
+    axis = {
+        'gridcolor': theme['grid_color'],
+        'linecolor': theme['grid_color'],
+        'zerolinecolor': theme['grid_color'],
+        'title': {'font': {'size': 13, 'color': theme['text_secondary']}},
+        'tickfont': {'size': 11, 'color': theme['text_secondary']}
+    }
+    
+    return {
+        'font': {
+            'family': 'Inter, sans-serif',
+            'size': 12,
+            'color': theme['text_color']
+        },
+        'paper_bgcolor': theme['bg_color'],
+        'plot_bgcolor': theme['plot_bg'],
+        'margin': {'l': 60, 'r': 40, 't': 80, 'b': 60},
+        'hovermode': 'closest',
+        'hoverlabel': {
+            'bgcolor': theme['bg_color'],
+            'bordercolor': theme['grid_color'],
+            'font': {'family': 'Inter, sans-serif', 'size': 13, 'color': theme['text_color']}
+        },
+        'xaxis': axis,
+        'yaxis': axis
+    }
+
+
+# Built once at import; Plotly copies layout kwargs, so sharing is safe
+_LAYOUT_TEMPLATES = {dark_mode: _build_layout_template(theme) for dark_mode, theme in _THEMES.items()}
+
+
+@functools.lru_cache(maxsize=32)
+def _error_figure(msg):
+    """Placeholder figure for a failed chart, shared per message (treat as read-only)"""
+    fig = go.Figure()
+    fig.add_annotation(text=f"Error: {msg}", showarrow=False)
+    return fig
+
+
 class Visualizer:
     """Professional visualization components with dark mode support"""
     
     def __init__(self, dark_mode=False):
         """
-        Initialize with custom color scheme and styling
+        Initialize styling; palette and layout are built lazily on first use
         
         Args:
             dark_mode (bool): Enable dark mode styling
         """
         self.dark_mode = dark_mode
-        
-        # Professional color palette
-        self.colors = {
+    
+    @functools.cached_property
+    def colors(self):
+        """Professional color palette"""
+        return {
             'Stars': '#f59e0b',
             'Cash Cows': '#10b981',
             'Developing': '#3b82f6',
             'Saturated': '#64748b',
             'forecast': '#dc2626',
-            'historical': '#0f172a' if not dark_mode else '#e2e8f0',
+            'historical': '#0f172a' if not self.dark_mode else '#e2e8f0',
             'ci': 'rgba(220, 38, 38, 0.15)',
             'primary': '#667eea',
             'secondary': '#764ba2'
         }
-        
-        # Theme-specific colors
-        if dark_mode:
-            self.bg_color = '#0f172a'
-            self.plot_bg = '#1e293b'
-            self.text_color = '#e2e8f0'
-            self.text_secondary = '#94a3b8'
-            self.grid_color = '#334155'
-            self.template = 'plotly_dark'
-        else:
-            self.bg_color = 'white'
-            self.plot_bg = '#fafafa'
-            self.text_color = '#374151'
-            self.text_secondary = '#6b7280'
-            self.grid_color = '#e5e7eb'
-            self.template = 'plotly_white'
-        
-        # Professional chart layout
-        self.layout_template = {
-            'font': {
-                'family': 'Inter, sans-serif',
-                'size': 12,
-                'color': self.text_color
-            },
-            'paper_bgcolor': self.bg_color,
-            'plot_bgcolor': self.plot_bg,
-            'margin': {'l': 60, 'r': 40, 't': 80, 'b': 60},
-            'hovermode': 'closest',
-            'hoverlabel': {
-                'bgcolor': self.bg_color,
-                'bordercolor': self.grid_color,
-                'font': {'family': 'Inter, sans-serif', 'size': 13, 'color': self.text_color}
-            },
-            'xaxis': {
-                'gridcolor': self.grid_color,
-                'linecolor': self.grid_color,
-                'zerolinecolor': self.grid_color,
-                'title': {'font': {'size': 13, 'color': self.text_secondary}},
-                'tickfont': {'size': 11, 'color': self.text_secondary}
-            },
-            'yaxis': {
-                'gridcolor': self.grid_color,
-                'linecolor': self.grid_color,
-                'zerolinecolor': self.grid_color,
-                'title': {'font': {'size': 13, 'color': self.text_secondary}},
-                'tickfont': {'size': 11, 'color': self.text_secondary}
-            }
-        }
+    
+    @functools.cached_property
+    def _segment_color_lookup(self):
+        """Segment → color lookup for the strategic segments"""
+        return {name: self.colors[name] for name in _SEGMENT_ORDER}
+    
+    @property
+    def _theme(self):
+        return _THEMES[bool(self.dark_mode)]
+    
+    @functools.cached_property
+    def bg_color(self):
+        return self._theme['bg_color']
+    
+    @functools.cached_property
+    def plot_bg(self):
+        return self._theme['plot_bg']
+    
+    @functools.cached_property
+    def text_color(self):
+        return self._theme['text_color']
+    
+    @functools.cached_property
+    def text_secondary(self):
+        return self._theme['text_secondary']
+    
+    @functools.cached_property
+    def grid_color(self):
+        return self._theme['grid_color']
+    
+    @functools.cached_property
+    def template(self):
+        return self._theme['template']
+    
+    @functools.cached_property
+    def layout_template(self):
+        """Professional chart layout, shared across instances"""
+        return _LAYOUT_TEMPLATES[bool(self.dark_mode)]
+    
+    def _layout(self, xaxis_title=None, yaxis_title=None, **kwargs):
+        """Layout dict for go.Figure: the theme template plus axis titles and overrides"""
+        layout = dict(self.layout_template)
+        for key, text in (('xaxis', xaxis_title), ('yaxis', yaxis_title)):
+            if text is not None:
+                axis = layout[key]
+                layout[key] = {**axis, 'title': {**axis['title'], 'text': text}}
+        layout.update(kwargs)
+        return layout
     
     def create_segment_pie(self, df):
         """
@@ -95,17 +177,17 @@ class Visualizer:
             plotly.graph_objects.Figure
         """
         try:
-            segment_counts = df['segment'].value_counts()
+            segments = df['segment']
+            if segments.dtype != _SEGMENT_DTYPE:
+                segments = segments.astype(_SEGMENT_DTYPE)
             
-            # Sort in strategic order
-            segment_order = ['Stars', 'Cash Cows', 'Developing', 'Saturated']
-            segment_counts = segment_counts.reindex(
-                [s for s in segment_order if s in segment_counts.index]
-            )
+            # Categorical counts come back in strategic order
+            segment_counts = segments.value_counts(sort=False)
+            segment_counts = segment_counts[segment_counts > 0]
             
-            colors = [self.colors[seg] for seg in segment_counts.index]
+            colors = segment_counts.index.map(self._segment_color_lookup.get).tolist()
             
-            fig = go.Figure(data=[go.Pie(
+            pie = go.Pie(
                 labels=segment_counts.index,
                 values=segment_counts.values,
                 marker=dict(
@@ -116,17 +198,17 @@ class Visualizer:
                 textfont=dict(size=13, color='white'),
                 hovertemplate='<b>%{label}</b><br>Regions: %{value}<br>Share: %{percent}<extra></extra>',
                 hole=0.4
-            )])
+            )
             
             # Center annotation
-            fig.add_annotation(
+            center = dict(
                 text=f"<b>{len(df)}</b><br><span style='font-size:11px'>regions</span>",
                 x=0.5, y=0.5,
                 font=dict(size=20, family='JetBrains Mono', color=self.text_color),
                 showarrow=False
             )
             
-            fig.update_layout(
+            layout = self._layout(
                 showlegend=True,
                 legend=dict(
                     orientation='h',
@@ -135,15 +217,15 @@ class Visualizer:
                     xanchor='center',
                     x=0.5
                 ),
-                height=450,
-                **self.layout_template
+                annotations=[center],
+                height=450
             )
             
-            return fig
+            return go.Figure(data=[pie], layout=layout)
         
         except Exception as e:
             print(f"Error in create_segment_pie: {e}")
-            return go.Figure().add_annotation(text=f"Error: {e}", showarrow=False)
+            return _error_figure(str(e))
     
     def create_quadrant_plot(self, df):
         """
@@ -156,61 +238,64 @@ class Visualizer:
             plotly.graph_objects.Figure
         """
         try:
-            fig = go.Figure()
-            
             # Calculate medians
-            tfr_median = df['tfr'].median()
-            exp_median = df['expenditure'].median()
+            medians = df[['tfr', 'expenditure']].median()
+            tfr_median = medians['tfr']
+            exp_median = medians['expenditure']
+            
+            if not isinstance(df['segment'].dtype, pd.CategoricalDtype):
+                df = df.assign(segment=df['segment'].astype(_SEGMENT_DTYPE))
             
             # Plot each segment
-            for segment in df['segment'].unique():
-                segment_data = df[df['segment'] == segment]
-                
-                fig.add_trace(go.Scatter(
-                    x=segment_data['tfr'],
-                    y=segment_data['expenditure'],
+            colors = self.colors
+            traces = [
+                go.Scattergl(
+                    x=segment_data['tfr'].to_numpy(dtype=np.float32),
+                    y=segment_data['expenditure'].to_numpy(dtype=np.float32),
                     mode='markers',
                     name=segment,
                     marker=dict(
                         size=10,
-                        color=self.colors[segment],
+                        color=colors[segment],
                         opacity=0.7,
                         line=dict(width=1, color=self.bg_color)
                     ),
-                    text=segment_data['region'],
+                    text=segment_data['region'].to_numpy(),
                     hovertemplate='<b>%{text}</b><br>TFR: %{x:.2f}<br>Expenditure: Rp %{y:,.0f}k<extra></extra>'
-                ))
+                )
+                for segment, segment_data in df.groupby('segment', sort=False, observed=True)
+            ]
             
             # Quadrant lines
-            fig.add_hline(y=exp_median, line_dash="dash", line_color=self.text_secondary, line_width=2, opacity=0.6)
-            fig.add_vline(x=tfr_median, line_dash="dash", line_color=self.text_secondary, line_width=2, opacity=0.6)
+            quadrant_line = dict(dash='dash', color=self.text_secondary, width=2)
+            shapes = [
+                dict(type='line', xref='x domain', x0=0, x1=1, yref='y', y0=exp_median, y1=exp_median,
+                     line=quadrant_line, opacity=0.6),
+                dict(type='line', xref='x', x0=tfr_median, x1=tfr_median, yref='y domain', y0=0, y1=1,
+                     line=quadrant_line, opacity=0.6)
+            ]
             
             # Quadrant labels
             annotations = [
-                dict(x=tfr_median * 1.3, y=exp_median * 1.15, text="Stars", showarrow=False,
-                     font=dict(size=14, color=self.colors['Stars']), opacity=0.3),
-                dict(x=tfr_median * 0.7, y=exp_median * 1.15, text="Cash Cows", showarrow=False,
-                     font=dict(size=14, color=self.colors['Cash Cows']), opacity=0.3),
-                dict(x=tfr_median * 1.3, y=exp_median * 0.85, text="Developing", showarrow=False,
-                     font=dict(size=14, color=self.colors['Developing']), opacity=0.3),
-                dict(x=tfr_median * 0.7, y=exp_median * 0.85, text="Saturated", showarrow=False,
-                     font=dict(size=14, color=self.colors['Saturated']), opacity=0.3)
+                dict(x=tfr_median * fx, y=exp_median * fy, text=name, showarrow=False,
+                     font=dict(size=14, color=colors[name]), opacity=0.3)
+                for fx, fy, name in _QUADRANT_SPEC
             ]
             
-            fig.update_layout(
+            layout = self._layout(
                 xaxis_title="Total Fertility Rate",
                 yaxis_title="Per Capita Expenditure (Rp 000s)",
                 annotations=annotations,
+                shapes=shapes,
                 legend=dict(orientation='h', yanchor='bottom', y=-0.2, xanchor='center', x=0.5),
-                height=600,
-                **self.layout_template
+                height=600
             )
             
-            return fig
+            return go.Figure(data=traces, layout=layout)
         
         except Exception as e:
             print(f"Error in create_quadrant_plot: {e}")
-            return go.Figure().add_annotation(text=f"Error: {e}", showarrow=False)
+            return _error_figure(str(e))
     
     def create_forecast_chart(self, df):
         """
@@ -223,28 +308,29 @@ class Visualizer:
             plotly.graph_objects.Figure
         """
         try:
-            fig = go.Figure()
+            exp_max = df['expenditure'].max()
             
-            # Historical data
-            hist_data = df[df['type'] == 'historical']
+            # Split historical/forecast rows in one pass
+            groups = dict(tuple(df.groupby('type', sort=False, observed=True)))
+            hist_data = groups.get('historical', df.iloc[:0])
+            forecast_data = groups.get('forecast', df.iloc[:0])
             
-            fig.add_trace(go.Scatter(
-                x=hist_data['year'],
-                y=hist_data['expenditure'],
+            # Historical data
+            traces = [go.Scattergl(
+                x=hist_data['year'].to_numpy(dtype=np.int16),
+                y=hist_data['expenditure'].to_numpy(dtype=np.float32),
                 mode='lines+markers',
                 name='Historical',
                 line=dict(color=self.colors['historical'], width=3),
                 marker=dict(size=6),
                 hovertemplate='<b>Year: %{x}</b><br>Expenditure: Rp %{y:,.0f}k<extra></extra>'
-            ))
+            )]
             
             # Forecast data
-            forecast_data = df[df['type'] == 'forecast']
-            
             if not forecast_data.empty:
-                fig.add_trace(go.Scatter(
-                    x=forecast_data['year'],
-                    y=forecast_data['expenditure'],
+                traces.append(go.Scattergl(
+                    x=forecast_data['year'].to_numpy(dtype=np.int16),
+                    y=forecast_data['expenditure'].to_numpy(dtype=np.float32),
                     mode='lines+markers',
                     name='Forecast',
                     line=dict(color=self.colors['forecast'], width=3, dash='dash'),
@@ -254,9 +340,14 @@ class Visualizer:
                 
                 # Confidence interval
                 if 'lower_ci' in forecast_data.columns and 'upper_ci' in forecast_data.columns:
-                    fig.add_trace(go.Scatter(
-                        x=list(forecast_data['year']) + list(forecast_data['year'])[::-1],
-                        y=list(forecast_data['upper_ci']) + list(forecast_data['lower_ci'])[::-1],
+                    yrs = forecast_data['year'].to_numpy(dtype=np.int16)
+                    x_poly = np.concatenate([yrs, yrs[::-1]])
+                    y_poly = np.concatenate([forecast_data['upper_ci'].to_numpy(dtype=np.float32),
+                                             forecast_data['lower_ci'].to_numpy(dtype=np.float32)[::-1]])
+                    
+                    traces.append(go.Scattergl(
+                        x=x_poly,
+                        y=y_poly,
                         fill='toself',
                         fillcolor=self.colors['ci'],
                         line=dict(color='rgba(255,255,255,0)'),
@@ -265,24 +356,26 @@ class Visualizer:
                         showlegend=True
                     ))
             
-            fig.update_layout(
+            # Current year line
+            current_line = dict(type='line', xref='x', x0=2025, x1=2025, yref='y domain', y0=0, y1=1,
+                                line=dict(dash='dot', color=self.text_secondary, width=1), opacity=0.5)
+            current_label = dict(x=2025, y=exp_max, text="Current",
+                                 showarrow=False, yshift=10, font=dict(size=10, color=self.text_secondary))
+            
+            layout = self._layout(
                 xaxis_title="Year",
                 yaxis_title="Per Capita Expenditure (Rp 000s)",
                 legend=dict(orientation='h', yanchor='bottom', y=-0.25, xanchor='center', x=0.5),
-                height=500,
-                **self.layout_template
+                shapes=[current_line],
+                annotations=[current_label],
+                height=500
             )
             
-            # Current year line
-            fig.add_vline(x=2025, line_dash="dot", line_color=self.text_secondary, line_width=1, opacity=0.5)
-            fig.add_annotation(x=2025, y=df['expenditure'].max(), text="Current",
-                             showarrow=False, yshift=10, font=dict(size=10, color=self.text_secondary))
-            
-            return fig
+            return go.Figure(data=traces, layout=layout)
         
         except Exception as e:
             print(f"Error in create_forecast_chart: {e}")
-            return go.Figure().add_annotation(text=f"Error: {e}", showarrow=False)
+            return _error_figure(str(e))
     
     def create_regional_forecast_chart(self, df):
         """
@@ -295,33 +388,65 @@ class Visualizer:
             plotly.graph_objects.Figure
         """
         try:
-            fig = go.Figure()
+            if len(df) > _RASTERIZE_THRESHOLD:
+                fig = self._create_rasterized_regional_chart(df)
+                if fig is not None:
+                    return fig
             
-            region_colors = px.colors.qualitative.Set2
-            
-            for idx, region in enumerate(df['region'].unique()):
-                region_data = df[df['region'] == region]
-                
-                fig.add_trace(go.Scatter(
-                    x=region_data['year'],
-                    y=region_data['expenditure'],
+            traces = [
+                go.Scattergl(
+                    x=region_data['year'].to_numpy(dtype=np.int16),
+                    y=region_data['expenditure'].to_numpy(dtype=np.float32),
                     mode='lines+markers',
                     name=region,
-                    line=dict(width=2.5),
+                    line=dict(width=2.5, color=_SET2[idx % len(_SET2)]),
                     marker=dict(size=5),
                     hovertemplate='<b>%{fullData.name}</b><br>Year: %{x}<br>Rp %{y:,.0f}k<extra></extra>'
-                ))
+                )
+                for idx, (region, region_data) in enumerate(df.groupby('region', sort=False, observed=True))
+            ]
             
-            fig.update_layout(
+            layout = self._layout(
                 xaxis_title="Year",
                 yaxis_title="Per Capita Expenditure (Rp 000s)",
                 legend=dict(orientation='v', yanchor='top', y=1, xanchor='left', x=1.02),
-                height=500,
-                **self.layout_template
+                height=500
             )
             
-            return fig
+            return go.Figure(data=traces, layout=layout)
         
         except Exception as e:
             print(f"Error in create_regional_forecast_chart: {e}")
-            return go.Figure().add_annotation(text=f"Error: {e}", showarrow=False)
\ No newline at end of file
+            return _error_figure(str(e))
+    
+    def _create_rasterized_regional_chart(self, df):
+        """Aggregate every region line into a single density heatmap (None without datashader)"""
+        # Imported here: datashader pulls in numba, dask and xarray, needed only for large frames
+        try:
+            import datashader as ds
+        except ImportError:
+            return None
+        
+        wide = df.pivot_table(index='region', columns='year', values='expenditure', observed=True)
+        years = wide.columns.to_numpy(dtype=np.float64)
+        wide.columns = wide.columns.astype(str)
+        
+        cvs = ds.Canvas(plot_width=800, plot_height=400)
+        agg = cvs.line(wide, x=years, y=list(wide.columns), agg=ds.count(), axis=1)
+        
+        heatmap = go.Heatmap(
+            z=agg.values,
+            x=agg.coords['x'].values,
+            y=agg.coords['y'].values,
+            colorscale='Viridis',
+            colorbar=dict(title='Regions'),
+            hovertemplate='Year: %{x:.0f}<br>Rp %{y:,.0f}k<br>Regions: %{z}<extra></extra>'
+        )
+        
+        layout = self._layout(
+            xaxis_title="Year",
+            yaxis_title="Per Capita Expenditure (Rp 000s)",
+            height=500
+        )
+        
+        return go.Figure(data=[heatmap], layout=layout)
\ No newline at end of file
@@ -4,17 +4,54 @@ Dashboard Test Script
 Validates dashboard functionality before deployment
 """
 
+import io
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+class _ThreadBufferedStdout:
+    """Route writes from worker threads into per-thread buffers"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+    
+    def capture(self, func):
+        """Run func with this thread's output buffered; return (result, output)"""
+        self._local.buffer = io.StringIO()
+        try:
+            return func(), self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+
+def _write(out):
+    """Flush a test's buffered lines with a single stdout write"""
+    sys.stdout.write('\n'.join(out) + '\n')
+
+
+def _section(title):
+    """Write a test's header up front so library output lands under it"""
+    _write(["\n" + "="*60, title, "="*60])
+    return []
+
+
 def test_imports():
     """Test all required imports"""
-    print("\n" + "="*60)
-    print("TESTING IMPORTS")
-    print("="*60)
+    out = _section("TESTING IMPORTS")
     
     required_modules = [
         ('streamlit', 'Streamlit'),
@@ -25,93 +62,100 @@ def test_imports():
     
     failed = []
     
+    # find_spec only locates the package, so no heavy __init__ runs here
     for module, name in required_modules:
-        try:
-            __import__(module)
-            print(f"   ✓ {name}")
-        except ImportError as e:
-            print(f"   ❌ {name}: {e}")
+        if find_spec(module) is None:
+            out.append(f"   ❌ {name}: not installed")
             failed.append(name)
+        else:
+            out.append(f"   ✓ {name}")
     
     if failed:
-        print(f"\n   ❌ Missing modules: {', '.join(failed)}")
-        print("   Run: pip install -r requirements.txt")
-        return False
+        out.append(f"\n   ❌ Missing modules: {', '.join(failed)}")
+        out.append("   Run: pip install -r requirements.txt")
     else:
-        print("\n   ✅ All imports successful")
-        return True
+        out.append("\n   ✅ All imports successful")
+    
+    _write(out)
+    return not failed
 
 
 def test_modules():
     """Test custom modules"""
-    print("\n" + "="*60)
-    print("TESTING CUSTOM MODULES")
-    print("="*60)
+    out = _section("TESTING CUSTOM MODULES")
     
     try:
         from src.data_loader import DataLoader
-        print("   ✓ DataLoader imported")
+        out.append("   ✓ DataLoader imported")
     except Exception as e:
-        print(f"   ❌ DataLoader import failed: {e}")
+        out.append(f"   ❌ DataLoader import failed: {e}")
+        _write(out)
         return False
     
     try:
         from src.visualizations import Visualizer
-        print("   ✓ Visualizer imported")
+        out.append("   ✓ Visualizer imported")
     except Exception as e:
-        print(f"   ❌ Visualizer import failed: {e}")
+        out.append(f"   ❌ Visualizer import failed: {e}")
+        _write(out)
         return False
     
-    print("\n   ✅ All custom modules loaded")
+    out.append("\n   ✅ All custom modules loaded")
+    _write(out)
     return True
 
 
-def test_data_loading():
+def test_data_loading(loader=None, segmentation=None):
     """Test data loading"""
-    print("\n" + "="*60)
-    print("TESTING DATA LOADING")
-    print("="*60)
+    out = _section("TESTING DATA LOADING")
     
     try:
-        from src.data_loader import DataLoader
-        loader = DataLoader()
+        if loader is None:
+            from src.data_loader import DataLoader
+            loader = DataLoader()
+        if segmentation is None:
+            segmentation = loader.load_market_segmentation()
         
         # Test each data loading method
         datasets = {
             'National Forecast': loader.load_national_forecast(),
-            'Market Segmentation': loader.load_market_segmentation(),
+            'Market Segmentation': segmentation,
             'Segment Statistics': loader.load_segment_statistics(),
         }
         
         for name, df in datasets.items():
             if df is not None and len(df) > 0:
-                print(f"   ✓ {name}: {len(df)} rows")
+                out.append(f"   ✓ {name}: {len(df)} rows")
             else:
-                print(f"   ⚠️  {name}: Empty or None (will use sample data)")
+                out.append(f"   ⚠️  {name}: Empty or None (will use sample data)")
         
-        print("\n   ✅ Data loading successful")
-        return True
+        out.append("\n   ✅ Data loading successful")
+        passed = True
         
     except Exception as e:
-        print(f"   ❌ Data loading failed: {e}")
+        out.append(f"   ❌ Data loading failed: {e}")
         import traceback
-        traceback.print_exc()
-        return False
+        out.append(traceback.format_exc().rstrip())
+        passed = False
+    
+    _write(out)
+    return passed
 
 
-def test_visualizations():
+def test_visualizations(loader=None, segmentation=None):
     """Test visualization creation"""
-    print("\n" + "="*60)
-    print("TESTING VISUALIZATIONS")
-    print("="*60)
+    out = _section("TESTING VISUALIZATIONS")
     
     try:
         from src.visualizations import Visualizer
-        from src.data_loader import DataLoader
         import pandas as pd
         
         viz = Visualizer()
-        loader = DataLoader()
+        if segmentation is None:
+            if loader is None:
+                from src.data_loader import DataLoader
+                loader = DataLoader()
+            segmentation = loader.load_market_segmentation()
         
         # Test with sample data
         sample_segment = pd.DataFrame({
@@ -123,29 +167,29 @@ def test_visualizations():
         fig = viz.create_segment_pie(sample_segment)
         
         if fig:
-            print("   ✓ Segment pie chart created")
+            out.append("   ✓ Segment pie chart created")
         
         # Test quadrant plot
-        segmentation = loader.load_market_segmentation()
         if segmentation is not None:
             fig = viz.create_quadrant_plot(segmentation)
-            print("   ✓ Quadrant plot created")
+            out.append("   ✓ Quadrant plot created")
         
-        print("\n   ✅ Visualizations working")
-        return True
+        out.append("\n   ✅ Visualizations working")
+        passed = True
         
     except Exception as e:
-        print(f"   ❌ Visualization test failed: {e}")
+        out.append(f"   ❌ Visualization test failed: {e}")
         import traceback
-        traceback.print_exc()
-        return False
+        out.append(traceback.format_exc().rstrip())
+        passed = False
+    
+    _write(out)
+    return passed
 
 
 def test_configuration():
     """Test configuration files"""
-    print("\n" + "="*60)
-    print("TESTING CONFIGURATION")
-    print("="*60)
+    out = _section("TESTING CONFIGURATION")
     
     required_files = {
         'app.py': 'Main application',
@@ -161,24 +205,23 @@ def test_configuration():
     for file_path, description in required_files.items():
         full_path = dashboard_root / file_path
         if full_path.exists():
-            print(f"   ✓ {description}: {file_path}")
+            out.append(f"   ✓ {description}: {file_path}")
         else:
-            print(f"   ❌ {description}: {file_path} - NOT FOUND")
+            out.append(f"   ❌ {description}: {file_path} - NOT FOUND")
             missing.append(file_path)
     
     if missing:
-        print(f"\n   ❌ Missing files: {len(missing)}")
-        return False
+        out.append(f"\n   ❌ Missing files: {len(missing)}")
     else:
-        print("\n   ✅ All configuration files present")
-        return True
+        out.append("\n   ✅ All configuration files present")
+    
+    _write(out)
+    return not missing
 
 
 def test_data_structure():
     """Test data directory structure"""
-    print("\n" + "="*60)
-    print("TESTING DATA STRUCTURE")
-    print("="*60)
+    out = _section("TESTING DATA STRUCTURE")
     
     dashboard_root = Path(__file__).parent
     
@@ -191,33 +234,47 @@ def test_data_structure():
     for dir_path in dirs:
         full_path = dashboard_root / dir_path
         if full_path.exists():
-            csv_count = len(list(full_path.glob('*.csv')))
-            print(f"   ✓ {dir_path}: {csv_count} CSV files")
+            # DirEntry.is_file uses the cached d_type, so no stat per file
+            with os.scandir(full_path) as entries:
+                file_count = sum(1 for entry in entries
+                                 if entry.name.endswith(('.csv', '.parquet')) and entry.is_file(follow_symlinks=False))
+            out.append(f"   ✓ {dir_path}: {file_count} data files")
         else:
-            print(f"   ⚠️  {dir_path}: Directory not found (will be created)")
+            out.append(f"   ⚠️  {dir_path}: Directory not found (will be created)")
     
-    print("\n   ✅ Data structure check complete")
+    out.append("\n   ✅ Data structure check complete")
+    _write(out)
     return True
 
 
 def run_all_tests():
     """Run all tests"""
-    print("="*60)
-    print("DASHBOARD PRE-DEPLOYMENT TESTS")
-    print("="*60)
+    _write(["="*60, "DASHBOARD PRE-DEPLOYMENT TESTS", "="*60])
     
-    tests = [
+    # Dependency checks run first; the remaining tests are independent
+    serial_tests = [
         ("Imports", test_imports),
-        ("Custom Modules", test_modules),
         ("Configuration", test_configuration),
+    ]
+    # Read the shared data once; tests fall back to their own loader on failure
+    shared_loader = shared_segmentation = None
+    try:
+        from src.data_loader import DataLoader
+        shared_loader = DataLoader()
+        shared_segmentation = shared_loader.load_market_segmentation()
+    except Exception:
+        pass
+    
+    parallel_tests = [
+        ("Custom Modules", test_modules),
         ("Data Structure", test_data_structure),
-        ("Data Loading", test_data_loading),
-        ("Visualizations", test_visualizations),
+        ("Data Loading", lambda: test_data_loading(shared_loader, shared_segmentation)),
+        ("Visualizations", lambda: test_visualizations(shared_loader, shared_segmentation)),
     ]
     
     results = []
     
-    for name, test_func in tests:
+    for name, test_func in serial_tests:
         try:
             result = test_func()
             results.append((name, result))
@@ -225,33 +282,52 @@ def run_all_tests():
             print(f"\n❌ {name} test crashed: {e}")
             results.append((name, False))
     
+    # Overlap file I/O; each test's output is buffered and printed in order
+    stdout = _ThreadBufferedStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {name: executor.submit(stdout.capture, test_func)
+                       for name, test_func in parallel_tests}
+            
+            for name, future in futures.items():
+                try:
+                    result, output = future.result()
+                    sys.stdout.write(output)
+                    results.append((name, result))
+                except Exception as e:
+                    print(f"\n❌ {name} test crashed: {e}")
+                    results.append((name, False))
+    finally:
+        sys.stdout = stdout._stream
+    
     # Summary
-    print("\n" + "="*60)
-    print("TEST SUMMARY")
-    print("="*60)
+    out = ["\n" + "="*60, "TEST SUMMARY", "="*60]
     
     for name, passed in results:
         status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"   {name:20s} {status}")
+        out.append(f"   {name:20s} {status}")
     
     total = len(results)
     passed = sum(1 for _, p in results if p)
     
-    print(f"\n   Total: {passed}/{total} tests passed")
+    out.append(f"\n   Total: {passed}/{total} tests passed")
     
     if passed == total:
-        print("\n" + "="*60)
-        print("✅ ALL TESTS PASSED - READY FOR DEPLOYMENT")
-        print("="*60)
-        print("\nNext steps:")
-        print("1. Test locally: streamlit run app.py")
-        print("2. Deploy to Hugging Face (see DEPLOYMENT.md)")
+        out.append("\n" + "="*60)
+        out.append("✅ ALL TESTS PASSED - READY FOR DEPLOYMENT")
+        out.append("="*60)
+        out.append("\nNext steps:")
+        out.append("1. Test locally: streamlit run app.py")
+        out.append("2. Deploy to Hugging Face (see DEPLOYMENT.md)")
+        _write(out)
         return 0
     else:
-        print("\n" + "="*60)
-        print("❌ SOME TESTS FAILED")
-        print("="*60)
-        print("\nFix the issues above before deploying")
+        out.append("\n" + "="*60)
+        out.append("❌ SOME TESTS FAILED")
+        out.append("="*60)
+        out.append("\nFix the issues above before deploying")
+        _write(out)
         return 1
 
 
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Parquet Conversion Script
+Writes a Parquet copy next to each dashboard CSV for faster loading
+"""
+
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from data_loader import _CSV_DTYPES, DataLoader, _parquet_is_current
+
+
+def convert_directory(directory):
+    """
+    Convert every CSV in a directory to a zstd-compressed Parquet sibling,
+    using the loader's declared dtypes and skipping up-to-date copies
+    
+    Args:
+        directory: Directory holding the CSV files
+        
+    Returns:
+        Number of files converted
+    """
+    if not directory.exists():
+        print(f"   ⚠️  {directory} not found")
+        return 0
+    
+    converted = 0
+    for csv_path in sorted(directory.glob('*.csv')):
+        parquet_path = csv_path.with_suffix('.parquet')
+        if _parquet_is_current(parquet_path, csv_path):
+            print(f"   ✓ {parquet_path.name} (up to date)")
+            continue
+        
+        # Same dtypes as the CSV read path, so both sources load identically
+        df = pd.read_csv(csv_path, dtype=_CSV_DTYPES.get(csv_path.name))
+        df.to_parquet(parquet_path, compression='zstd', engine='pyarrow', index=False)
+        print(f"   ✓ {parquet_path.name}")
+        converted += 1
+    
+    return converted
+
+
+def main():
+    """Convert processed and interim data"""
+    print("="*60)
+    print("PARQUET CONVERSION")
+    print("="*60)
+    
+    loader = DataLoader()
+    
+    print("\n📁 Converting processed data...")
+    total = convert_directory(loader.processed_dir)
+    
+    print("\n📁 Converting interim data...")
+    total += convert_directory(loader.interim_dir)
+    
+    print(f"\n✅ {total} files converted")
+
+
+if __name__ == '__main__':
+    try:
+        main()
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Conversion failed: {e}")
+        sys.exit(1)
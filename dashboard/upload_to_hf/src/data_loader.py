@@ -3,10 +3,156 @@ Data Loader Module
 Handles loading and caching of data files
 """
 
+import functools
+import tempfile
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import streamlit as st
 
+try:
+    import pyarrow
+    _HAS_PYARROW = True
+    _PARQUET_WRITE_ERRORS = (OSError, pyarrow.ArrowException)
+except ImportError:
+    _HAS_PYARROW = False
+    _PARQUET_WRITE_ERRORS = (OSError,)
+
+_CSV_ENGINE = 'pyarrow' if _HAS_PYARROW else 'c'
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Declared numeric column types so the parser skips inference
+_CSV_DTYPES = {
+    'national_expenditure_forecast.csv': {
+        'year': 'int16', 'expenditure': 'float64', 'lower_ci': 'float64', 'upper_ci': 'float64'
+    },
+    'regional_expenditure_forecasts.csv': {
+        'year': 'int16', 'expenditure': 'float64', 'lower_ci': 'float64', 'upper_ci': 'float64'
+    },
+    'market_segmentation.csv': {'tfr': 'float64', 'expenditure': 'float64'},
+    'segment_statistics.csv': {
+        'count': 'int64',
+        'tfr_mean': 'float64', 'tfr_median': 'float64', 'tfr_std': 'float64',
+        'expenditure_mean': 'float64', 'expenditure_median': 'float64', 'expenditure_std': 'float64'
+    },
+    'expenditure_clean.csv': {'year': 'int16', 'expenditure': 'float64'},
+    'tfr_clean.csv': {'year': 'int16', 'tfr': 'float64'},
+}
+
+
+# Display order of the quadrant segments
+_SEGMENT_ORDER = ['Stars', 'Cash Cows', 'Developing', 'Saturated']
+
+# Row types of the national forecast file
+_FORECAST_TYPES = ['historical', 'forecast']
+
+# Columns needed to derive segment statistics from the segmentation file
+_SEGMENT_STATS_COLUMNS = ['region_name', 'segment', 'tfr', 'expenditure']
+
+
+def _read_csv_fast(path: str, dtype=None, usecols=None) -> pd.DataFrame:
+    """Parse a CSV with Polars' multithreaded reader, falling back to pandas"""
+    if pl is None:
+        return pd.read_csv(path, engine=_CSV_ENGINE, dtype=dtype, usecols=usecols)
+    
+    if not Path(path).exists():
+        raise FileNotFoundError(path)
+    
+    lazy = pl.scan_csv(path, infer_schema_length=10000)
+    if usecols is not None:
+        lazy = lazy.select(usecols)
+    df = lazy.collect().to_pandas()
+    
+    if dtype:
+        df = df.astype({col: col_type for col, col_type in dtype.items() if col in df.columns})
+    return df
+
+
+# mtime is part of the cache key, so an updated file is re-read instead of
+# serving (and re-persisting) the frame cached before the update
+@st.cache_data(show_spinner=False, ttl=3600)
+def _read_csv_cached(path: str, mtime: float, dtype=None, usecols=None) -> pd.DataFrame:
+    """Parse a CSV once per file version; reruns reuse the cached frame"""
+    return _read_csv_fast(path, dtype, usecols)
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _read_parquet_cached(path: str, mtime: float, columns=None) -> pd.DataFrame:
+    """Read a Parquet file once per file version, decoding only the requested columns"""
+    return pd.read_parquet(path, columns=columns)
+
+
+def _parquet_is_current(parquet_path, csv_path):
+    """True when the Parquet copy exists and is not older than its CSV"""
+    try:
+        parquet_mtime = parquet_path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    try:
+        return parquet_mtime >= csv_path.stat().st_mtime
+    except FileNotFoundError:
+        # Parquet-only deployments have no CSV to compare against
+        return True
+
+
+def _write_parquet_sibling(df, parquet_path):
+    """Persist a parsed CSV as Parquet so the next cold start skips text parsing"""
+    tmp_path = None
+    try:
+        # Unique temp name so concurrent sessions never write the same file
+        with tempfile.NamedTemporaryFile(dir=parquet_path.parent, prefix=f'.{parquet_path.stem}.',
+                                         suffix='.parquet.tmp', delete=False) as tmp:
+            tmp_path = Path(tmp.name)
+        df.to_parquet(tmp_path, compression='zstd', engine='pyarrow', index=False)
+        tmp_path.replace(parquet_path)
+    except _PARQUET_WRITE_ERRORS:
+        # Read-only deployments or frames Arrow cannot encode keep serving from the CSV
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+
+
+def _categorize_segmentation(df):
+    """Store segment and region_name as categoricals; unknown segments sort last"""
+    extra = sorted(set(df['segment'].dropna().unique()).difference(_SEGMENT_ORDER))
+    return df.assign(
+        segment=pd.Categorical(df['segment'], categories=_SEGMENT_ORDER + extra),
+        region_name=df['region_name'].astype('category')
+    )
+
+
+def _categorize_regions(df):
+    """Store region_name as a categorical so filters compare integer codes"""
+    if df is None or 'region_name' not in df.columns:
+        return df
+    return df.assign(region_name=df['region_name'].astype('category'))
+
+
+def _categorize_forecast(df):
+    """Store the historical/forecast row type as a categorical"""
+    return df.assign(type=pd.Categorical(df['type'], categories=_FORECAST_TYPES))
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_data_dir() -> Path:
+    """Locate the data directory once per process"""
+    # Try multiple paths for flexibility
+    possible_paths = [
+        Path(__file__).parents[2] / 'data',  # From dashboard/src/
+        Path('/home/claude/data'),  # Absolute path
+        Path('data'),  # Relative to execution directory
+    ]
+    
+    for path in possible_paths:
+        if path.exists():
+            return path
+    
+    # If no data directory found, use first option and let it create
+    return possible_paths[0]
+
 
 class DataLoader:
     """Load and cache dashboard data"""
@@ -18,41 +164,44 @@ class DataLoader:
         Args:
             data_dir: Path to data directory (auto-detected if None)
         """
-        if data_dir is None:
-            # Try multiple paths for flexibility
-            possible_paths = [
-                Path(__file__).parents[2] / 'data',  # From dashboard/src/
-                Path('/home/claude/data'),  # Absolute path
-                Path('data'),  # Relative to execution directory
-            ]
-            
-            for path in possible_paths:
-                if path.exists():
-                    self.data_dir = path
-                    break
-            else:
-                # If no data directory found, use first option and let it create
-                self.data_dir = possible_paths[0]
-        else:
-            self.data_dir = Path(data_dir)
+        self.data_dir = _resolve_data_dir() if data_dir is None else Path(data_dir)
         
         self.processed_dir = self.data_dir / 'processed'
         self.interim_dir = self.data_dir / 'interim'
     
+    def _read_csv(self, path, columns=None):
+        """
+        Read a data file, preferring its Parquet sibling unless the CSV is newer;
+        a full CSV read (re)writes that sibling for later runs
+        
+        Args:
+            path: Path to the CSV file
+            columns: Optional subset of columns to load
+        """
+        parquet_path = path.with_suffix('.parquet')
+        if _parquet_is_current(parquet_path, path):
+            return _read_parquet_cached(str(parquet_path), parquet_path.stat().st_mtime, columns)
+        
+        # stat() raises FileNotFoundError for a missing CSV, as read_csv would
+        df = _read_csv_cached(str(path), path.stat().st_mtime, _CSV_DTYPES.get(path.name), columns)
+        if _HAS_PYARROW and columns is None:
+            _write_parquet_sibling(df, parquet_path)
+        return df
+    
     def load_national_forecast(self):
         """Load national expenditure forecast"""
         try:
-            df = pd.read_csv(self.processed_dir / 'national_expenditure_forecast.csv')
-            return df
+            df = self._read_csv(self.processed_dir / 'national_expenditure_forecast.csv')
+            return _categorize_forecast(df)
         except FileNotFoundError:
             st.warning("National forecast data not found")
-            return self._generate_sample_national_forecast()
+            return _categorize_forecast(self._generate_sample_national_forecast())
     
     def load_regional_forecasts(self):
         """Load regional expenditure forecasts"""
         try:
-            df = pd.read_csv(self.processed_dir / 'regional_expenditure_forecasts.csv')
-            return df
+            df = self._read_csv(self.processed_dir / 'regional_expenditure_forecasts.csv')
+            return _categorize_regions(df)
         except FileNotFoundError:
             st.warning("Regional forecast data not found")
             return None
@@ -60,8 +209,8 @@ class DataLoader:
     def load_market_segmentation(self):
         """Load market segmentation data"""
         try:
-            df = pd.read_csv(self.processed_dir / 'market_segmentation.csv')
-            return df
+            df = self._read_csv(self.processed_dir / 'market_segmentation.csv')
+            return _categorize_segmentation(df)
         except FileNotFoundError:
             st.warning("Market segmentation data not found")
             return self._generate_sample_segmentation()
@@ -69,80 +218,81 @@ class DataLoader:
     def load_segment_statistics(self):
         """Load segment statistics"""
         try:
-            df = pd.read_csv(self.processed_dir / 'segment_statistics.csv')
+            df = self._read_csv(self.processed_dir / 'segment_statistics.csv')
             return df
         except FileNotFoundError:
             # Calculate from segmentation if not available
-            segmentation = self.load_market_segmentation()
+            try:
+                segmentation = self._read_csv(
+                    self.processed_dir / 'market_segmentation.csv', columns=_SEGMENT_STATS_COLUMNS
+                )
+            except FileNotFoundError:
+                segmentation = self.load_market_segmentation()
             return self._calculate_segment_stats(segmentation)
     
     def load_expenditure_historical(self):
         """Load historical expenditure data"""
         try:
-            df = pd.read_csv(self.interim_dir / 'expenditure_clean.csv')
-            return df
+            df = self._read_csv(self.interim_dir / 'expenditure_clean.csv')
+            return _categorize_regions(df)
         except FileNotFoundError:
             st.warning("Historical expenditure data not found")
-            return self._generate_sample_historical()
+            return _categorize_regions(self._generate_sample_historical())
     
     def load_tfr_data(self):
         """Load TFR data"""
         try:
-            df = pd.read_csv(self.interim_dir / 'tfr_clean.csv')
-            return df
+            df = self._read_csv(self.interim_dir / 'tfr_clean.csv')
+            return _categorize_regions(df)
         except FileNotFoundError:
             st.warning("TFR data not found")
             return None
     
-    def _calculate_segment_stats(self, segmentation):
+    @staticmethod
+    def _calculate_segment_stats(segmentation):
         """Calculate segment statistics from segmentation data"""
-        stats = segmentation.groupby('segment').agg({
-            'region_name': 'count',
-            'tfr': ['mean', 'median', 'std'],
-            'expenditure': ['mean', 'median', 'std']
-        }).round(2)
-        
-        stats.columns = ['_'.join(col).strip() for col in stats.columns.values]
-        stats = stats.rename(columns={'region_name_count': 'count'})
-        stats = stats.reset_index()
-        
-        return stats
+        return segmentation.groupby('segment', observed=True).agg(
+            count=('region_name', 'count'),
+            tfr_mean=('tfr', 'mean'),
+            tfr_median=('tfr', 'median'),
+            tfr_std=('tfr', 'std'),
+            expenditure_mean=('expenditure', 'mean'),
+            expenditure_median=('expenditure', 'median'),
+            expenditure_std=('expenditure', 'std')
+        ).round(2).reset_index()
     
     def _generate_sample_national_forecast(self):
         """Generate sample national forecast data for demo"""
-        import numpy as np
-        
         # Historical data (2010-2025)
-        years_hist = list(range(2010, 2026))
-        base_exp = 8000
+        years_hist = np.arange(2010, 2026, dtype=np.int16)
+        base_exp = 8000.0
         growth_rate = 1.05
+        exp_hist = base_exp * np.power(growth_rate, years_hist - 2010)
         
         historical = pd.DataFrame({
             'year': years_hist,
-            'expenditure': [base_exp * (growth_rate ** (i - 2010)) for i in years_hist],
+            'expenditure': exp_hist,
             'type': 'historical',
             'lower_ci': np.nan,
             'upper_ci': np.nan
         })
         
         # Forecast data (2026-2030)
-        years_fcst = list(range(2026, 2031))
-        last_value = historical['expenditure'].iloc[-1]
+        years_fcst = np.arange(2026, 2031, dtype=np.int16)
+        exp_fcst = exp_hist[-1] * np.power(growth_rate, years_fcst - 2025)
         
         forecast = pd.DataFrame({
             'year': years_fcst,
-            'expenditure': [last_value * (growth_rate ** (i - 2025)) for i in years_fcst],
+            'expenditure': exp_fcst,
             'type': 'forecast',
-            'lower_ci': [last_value * (growth_rate ** (i - 2025)) * 0.9 for i in years_fcst],
-            'upper_ci': [last_value * (growth_rate ** (i - 2025)) * 1.1 for i in years_fcst]
+            'lower_ci': exp_fcst * 0.9,
+            'upper_ci': exp_fcst * 1.1
         })
         
         return pd.concat([historical, forecast], ignore_index=True)
     
     def _generate_sample_segmentation(self):
         """Generate sample segmentation data for demo"""
-        import numpy as np
-        
         np.random.seed(42)
         
         regions = [
@@ -151,62 +301,69 @@ class DataLoader:
             'BOGOR', 'MALANG', 'YOGYAKARTA', 'SOLO', 'BALIKPAPAN'
         ]
         
-        data = []
-        for region in regions:
-            tfr = np.random.uniform(1.5, 3.5)
-            expenditure = np.random.uniform(8000, 18000)
-            
-            # Determine segment
-            if tfr >= 2.3 and expenditure >= 12000:
-                segment = 'Stars'
-            elif tfr < 2.3 and expenditure >= 12000:
-                segment = 'Cash Cows'
-            elif tfr >= 2.3 and expenditure < 12000:
-                segment = 'Developing'
-            else:
-                segment = 'Saturated'
-            
-            data.append({
-                'region_name': region,
-                'tfr': round(tfr, 2),
-                'expenditure': int(expenditure),
-                'segment': segment
-            })
+        # One (tfr, expenditure) draw per region, same order as per-region calls
+        draws = np.random.uniform([1.5, 8000], [3.5, 18000], size=(len(regions), 2))
+        tfr, expenditure = draws[:, 0], draws[:, 1]
+        
+        # Determine segment
+        high_tfr = tfr >= 2.3
+        high_exp = expenditure >= 12000
+        segment = np.select(
+            [high_tfr & high_exp, ~high_tfr & high_exp, high_tfr & ~high_exp],
+            ['Stars', 'Cash Cows', 'Developing'],
+            default='Saturated'
+        )
         
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            'region_name': pd.Categorical(regions),
+            'tfr': tfr.round(2),
+            'expenditure': expenditure.astype(np.int32),
+            'segment': pd.Categorical(segment, categories=_SEGMENT_ORDER)
+        })
     
     def _generate_sample_historical(self):
         """Generate sample historical expenditure data"""
-        import numpy as np
-        
         regions = ['JAKARTA', 'SURABAYA', 'BANDUNG']
-        years = list(range(2010, 2026))
+        years = np.arange(2010, 2026, dtype=np.int16)
         
-        data = []
-        for region in regions:
-            base = np.random.uniform(8000, 15000)
-            growth = np.random.uniform(1.03, 1.06)
-            
-            for year in years:
-                exp = base * (growth ** (year - 2010))
-                data.append({
-                    'region_name': region,
-                    'year': year,
-                    'expenditure': int(exp)
-                })
+        # One (base, growth) draw per region, same order as per-region calls
+        params = np.random.uniform([8000, 1.03], [15000, 1.06], size=(len(regions), 2))
+        expenditure = params[:, [0]] * params[:, [1]] ** (years - 2010)
         
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            'region_name': np.repeat(regions, len(years)),
+            'year': np.tile(years, len(regions)),
+            'expenditure': expenditure.ravel().astype(np.int64)
+        })
 
 
-# Convenience function for quick data loading
-def get_data():
-    """Quick data loading function"""
-    loader = DataLoader()
+@st.cache_resource
+def get_loader():
+    """Shared DataLoader so path probing runs once per server"""
+    return DataLoader()
+
+
+def get_core_data():
+    """Datasets used by every page"""
+    loader = get_loader()
     return {
         'national_forecast': loader.load_national_forecast(),
-        'regional_forecasts': loader.load_regional_forecasts(),
         'segmentation': loader.load_market_segmentation(),
         'segment_stats': loader.load_segment_statistics(),
+    }
+
+
+def get_regional_data():
+    """Regional datasets, loaded only by the pages that show them"""
+    loader = get_loader()
+    return {
+        'regional_forecasts': loader.load_regional_forecasts(),
         'expenditure_historical': loader.load_expenditure_historical(),
         'tfr_data': loader.load_tfr_data(),
-    }
\ No newline at end of file
+    }
+
+
+# Convenience function for quick data loading
+def get_data():
+    """Quick data loading function"""
+    return {**get_core_data(), **get_regional_data()}
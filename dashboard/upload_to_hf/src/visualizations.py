@@ -8,24 +8,45 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+import streamlit as st
+
+try:
+    import orjson  # noqa: F401
+    import plotly.io as pio
+    
+    # Serialize figures with orjson, which encodes numpy arrays natively
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+
+def _hash_dataframe(df):
+    """Cache key for DataFrame arguments"""
+    return (df.shape, tuple(df.columns), pd.util.hash_pandas_object(df, index=False).values.tobytes())
+
+
+# Bounded: filter-driven keys (e.g. quadrant highlights) would otherwise grow without limit
+@st.cache_data(hash_funcs={pd.DataFrame: _hash_dataframe}, show_spinner=False, ttl=3600, max_entries=32)
+def _cached_figure(builder, *args):
+    """Build a figure once per builder and argument set"""
+    return getattr(Visualizer(), builder)(*args)
 
 
 class Visualizer:
     """Create professional visualizations"""
     
-    def __init__(self):
-        """Initialize visualizer with custom theme"""
-        self.colors = {
-            'Stars': '#FFD700',
-            'Cash Cows': '#90EE90',
-            'Developing': '#87CEEB',
-            'Saturated': '#FFB6C1',
-            'forecast': '#FF6B6B',
-            'historical': '#1f77b4',
-            'ci': 'rgba(255, 107, 107, 0.2)'
-        }
-        
-        self.template = 'plotly_white'
+    # Custom theme, shared by every instance
+    colors = {
+        'Stars': '#FFD700',
+        'Cash Cows': '#90EE90',
+        'Developing': '#87CEEB',
+        'Saturated': '#FFB6C1',
+        'forecast': '#FF6B6B',
+        'historical': '#1f77b4',
+        'ci': 'rgba(255, 107, 107, 0.2)'
+    }
+    
+    template = 'plotly_white'
     
     def create_segment_pie(self, segmentation_df):
         """
@@ -37,7 +58,12 @@ class Visualizer:
         Returns:
             Plotly figure
         """
+        return _cached_figure('_build_segment_pie', segmentation_df)
+    
+    def _build_segment_pie(self, segmentation_df):
+        """Uncached body of create_segment_pie"""
         segment_counts = segmentation_df['segment'].value_counts()
+        segment_counts = segment_counts[segment_counts > 0]
         
         fig = go.Figure(data=[go.Pie(
             labels=segment_counts.index,
@@ -75,22 +101,31 @@ class Visualizer:
         Returns:
             Plotly figure
         """
-        # Calculate thresholds
-        tfr_threshold = segmentation_df['tfr'].median()
-        exp_threshold = segmentation_df['expenditure'].median()
-        
-        # Create base plot
-        fig = px.scatter(
-            segmentation_df,
-            x='tfr',
-            y='expenditure',
-            color='segment',
-            hover_name='region_name',
-            hover_data={'tfr': ':.2f', 'expenditure': ':,.0f', 'segment': True},
-            color_discrete_map=self.colors,
-            template=self.template,
-            height=600
-        )
+        # Sorted tuple gives a stable cache key regardless of filter order
+        highlight = tuple(sorted(highlight_regions)) if highlight_regions else None
+        return _cached_figure('_build_quadrant_plot', segmentation_df, highlight)
+    
+    def _build_quadrant_plot(self, segmentation_df, highlight_regions=None):
+        """Uncached body of create_quadrant_plot"""
+        # Calculate thresholds and ranges in one pass per column
+        tfr_lo, tfr_threshold, tfr_hi = np.nanpercentile(segmentation_df['tfr'].to_numpy(dtype=float), [0, 50, 100])
+        exp_lo, exp_threshold, exp_hi = np.nanpercentile(segmentation_df['expenditure'].to_numpy(dtype=float), [0, 50, 100])
+        
+        # Create base plot: one WebGL trace per segment
+        fig = go.Figure()
+        for segment, group in segmentation_df.groupby('segment', observed=True, sort=False):
+            fig.add_trace(go.Scattergl(
+                x=group['tfr'].to_numpy(),
+                y=group['expenditure'].to_numpy(),
+                mode='markers',
+                name=str(segment),
+                marker=dict(color=self.colors.get(segment, '#cccccc'), size=10),
+                text=group['region_name'].to_numpy(),
+                hovertemplate=(
+                    f'<b>%{{text}}</b><br>TFR: %{{x:.2f}}<br>'
+                    f'Expenditure: %{{y:,.0f}}<br>Segment: {segment}<extra></extra>'
+                )
+            ))
         
         # Add threshold lines
         fig.add_hline(
@@ -112,8 +147,8 @@ class Visualizer:
         )
         
         # Add quadrant labels
-        x_range = segmentation_df['tfr'].max() - segmentation_df['tfr'].min()
-        y_range = segmentation_df['expenditure'].max() - segmentation_df['expenditure'].min()
+        x_range = tfr_hi - tfr_lo
+        y_range = exp_hi - exp_lo
         
         quadrant_annotations = [
             dict(x=tfr_threshold + x_range * 0.15, y=exp_threshold + y_range * 0.4,
@@ -130,7 +165,7 @@ class Visualizer:
         if highlight_regions:
             highlight_df = segmentation_df[segmentation_df['region_name'].isin(highlight_regions)]
             
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=highlight_df['tfr'],
                 y=highlight_df['expenditure'],
                 mode='markers',
@@ -145,6 +180,9 @@ class Visualizer:
             ))
         
         fig.update_layout(
+            template=self.template,
+            height=600,
+            legend_title_text='segment',
             annotations=quadrant_annotations,
             xaxis_title="Total Fertility Rate (TFR)",
             yaxis_title="Per Capita Expenditure (Rp 000)",
@@ -163,13 +201,20 @@ class Visualizer:
         Returns:
             Plotly figure
         """
-        historical = national_forecast_df[national_forecast_df['type'] == 'historical']
-        forecast = national_forecast_df[national_forecast_df['type'] == 'forecast']
+        return _cached_figure('_build_forecast_chart', national_forecast_df)
+    
+    def _build_forecast_chart(self, national_forecast_df):
+        """Uncached body of create_forecast_chart"""
+        # Split by row type in one pass
+        parts = dict(list(national_forecast_df.groupby('type', observed=True, sort=False)))
+        empty = national_forecast_df.iloc[:0]
+        historical = parts.get('historical', empty)
+        forecast = parts.get('forecast', empty)
         
         fig = go.Figure()
         
         # Historical data
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=historical['year'],
             y=historical['expenditure'],
             mode='lines+markers',
@@ -180,7 +225,7 @@ class Visualizer:
         ))
         
         # Forecast data
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=forecast['year'],
             y=forecast['expenditure'],
             mode='lines+markers',
@@ -191,10 +236,13 @@ class Visualizer:
         ))
         
         # Confidence interval
-        if 'lower_ci' in forecast.columns and 'upper_ci' in forecast.columns:
-            fig.add_trace(go.Scatter(
-                x=forecast['year'].tolist() + forecast['year'].tolist()[::-1],
-                y=forecast['upper_ci'].tolist() + forecast['lower_ci'].tolist()[::-1],
+        if {'lower_ci', 'upper_ci'}.issubset(forecast.columns) and forecast[['lower_ci', 'upper_ci']].notna().any().all():
+            years = forecast['year'].to_numpy()
+            upper = forecast['upper_ci'].to_numpy()
+            lower = forecast['lower_ci'].to_numpy()
+            fig.add_trace(go.Scattergl(
+                x=np.concatenate([years, years[::-1]]),
+                y=np.concatenate([upper, lower[::-1]]),
                 fill='toself',
                 fillcolor=self.colors['ci'],
                 line=dict(color='rgba(255,255,255,0)'),
@@ -243,18 +291,26 @@ class Visualizer:
         Returns:
             Plotly figure
         """
+        return _cached_figure('_build_regional_forecast_chart', historical_df, forecast_df, regions)
+    
+    def _build_regional_forecast_chart(self, historical_df, forecast_df, regions):
+        """Uncached body of create_regional_forecast_chart"""
         fig = go.Figure()
         
         # Color palette
         colors = px.colors.qualitative.Set2
         
+        # Split each frame by region once instead of masking per region
+        hist_groups = dict(list(historical_df.groupby('region_name', sort=False, observed=True)))
+        fcst_groups = dict(list(forecast_df.groupby('region_name', sort=False, observed=True)))
+        
         for idx, region in enumerate(regions):
             color = colors[idx % len(colors)]
             
             # Historical
-            hist_data = historical_df[historical_df['region_name'] == region]
-            if len(hist_data) > 0:
-                fig.add_trace(go.Scatter(
+            hist_data = hist_groups.get(region)
+            if hist_data is not None and len(hist_data) > 0:
+                fig.add_trace(go.Scattergl(
                     x=hist_data['year'],
                     y=hist_data['expenditure'],
                     mode='lines+markers',
@@ -266,9 +322,9 @@ class Visualizer:
                 ))
             
             # Forecast
-            fcst_data = forecast_df[forecast_df['region_name'] == region]
-            if len(fcst_data) > 0:
-                fig.add_trace(go.Scatter(
+            fcst_data = fcst_groups.get(region)
+            if fcst_data is not None and len(fcst_data) > 0:
+                fig.add_trace(go.Scattergl(
                     x=fcst_data['year'],
                     y=fcst_data['forecast'],
                     mode='lines+markers',
@@ -306,19 +362,26 @@ class Visualizer:
         Returns:
             Plotly figure
         """
+        return _cached_figure('_build_segment_bars', segment_stats_df)
+    
+    def _build_segment_bars(self, segment_stats_df):
+        """Uncached body of create_segment_bars"""
         fig = make_subplots(
             rows=1, cols=2,
             subplot_titles=("Average TFR by Segment", "Average Expenditure by Segment")
         )
         
+        segments = segment_stats_df['segment'].to_numpy()
+        bar_colors = [self.colors.get(s, '#cccccc') for s in segments]
+        
         # TFR bars
         fig.add_trace(
             go.Bar(
-                x=segment_stats_df['segment'],
+                x=segments,
                 y=segment_stats_df['tfr_mean'],
-                marker_color=[self.colors.get(s, '#cccccc') for s in segment_stats_df['segment']],
+                marker_color=bar_colors,
                 name='TFR',
-                text=segment_stats_df['tfr_mean'].round(2),
+                texttemplate='%{y:.2f}',
                 textposition='outside',
                 hovertemplate='<b>%{x}</b><br>Avg TFR: %{y:.2f}<extra></extra>'
             ),
@@ -328,11 +391,11 @@ class Visualizer:
         # Expenditure bars
         fig.add_trace(
             go.Bar(
-                x=segment_stats_df['segment'],
+                x=segments,
                 y=segment_stats_df['expenditure_mean'],
-                marker_color=[self.colors.get(s, '#cccccc') for s in segment_stats_df['segment']],
+                marker_color=bar_colors,
                 name='Expenditure',
-                text=segment_stats_df['expenditure_mean'].round(0).astype(int),
+                texttemplate='%{y:.0f}',
                 textposition='outside',
                 hovertemplate='<b>%{x}</b><br>Avg Expenditure: Rp %{y:,.0f}k<extra></extra>'
             ),
@@ -366,19 +429,29 @@ class Visualizer:
         Returns:
             Plotly figure
         """
-        pivot = data_df.pivot_table(
-            index=y_col,
-            columns=x_col,
-            values=value_col,
-            aggfunc='mean'
-        )
+        return _cached_figure('_build_heatmap', data_df, x_col, y_col, value_col, title)
+    
+    def _build_heatmap(self, data_df, x_col, y_col, value_col, title=""):
+        """Uncached body of create_heatmap"""
+        # Plain reshape when each (y, x) pair is unique; average duplicates otherwise
+        if data_df.duplicated(subset=[y_col, x_col]).any():
+            pivot = data_df.pivot_table(
+                index=y_col,
+                columns=x_col,
+                values=value_col,
+                aggfunc='mean'
+            )
+        else:
+            pivot = data_df.pivot(index=y_col, columns=x_col, values=value_col)
+        
+        z = pivot.to_numpy()
         
         fig = go.Figure(data=go.Heatmap(
-            z=pivot.values,
+            z=z,
             x=pivot.columns,
             y=pivot.index,
             colorscale='RdYlGn',
-            text=pivot.values.round(0),
+            text=np.round(z, 0),
             texttemplate='%{text}',
             textfont={"size": 10},
             hovertemplate='<b>%{y}</b><br>%{x}: %{z:,.0f}<extra></extra>'